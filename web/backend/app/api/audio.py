@@ -1,35 +1,54 @@
 """Audio upload and management API endpoints."""
 
-import shutil
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Tuple
+from uuid import uuid4
+import aiofiles
 from fastapi import APIRouter, UploadFile, File, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from ..database import get_db
+from ..database import get_async_db
 from ..models import AudioFile, SourceType
 from ..schemas import AudioFileResponse
-from ..services.audio_processor import AudioProcessor
+from ..services import audio_processor
 from ..core.config import settings
 
 router = APIRouter(prefix="/api/audio", tags=["audio"])
-audio_processor = AudioProcessor(storage_path=settings.STORAGE_PATH)
 
+# Read size for streaming uploads to disk (8 MiB)
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
 
-@router.post("/upload", response_model=AudioFileResponse)
-async def upload_audio(
-    file: UploadFile = File(...),
-    db: Session = Depends(get_db)
-):
+# Worker processes for ffprobe/soundfile metadata probes, so concurrent uploads
+# probe in parallel without holding the API process's GIL (started lazily).
+# Workers come from a forkserver rather than forking the multithreaded API
+# process, and probes are I/O-heavy, so a few are enough
+PROBE_WORKERS = min(4, os.cpu_count() or 1)
+probe_executor = ProcessPoolExecutor(
+    max_workers=PROBE_WORKERS,
+    mp_context=multiprocessing.get_context("forkserver")
+)
+
+
+def _probe_audio(file_path: str) -> Dict:
+    """Probe audio metadata in a pool worker, through that worker's own shared AudioProcessor and cache."""
+    return audio_processor.get_audio_info(file_path)
+
+
+async def _receive_upload(file: UploadFile) -> Tuple[Path, str]:
     """
-    Upload an audio file.
+    Stream an upload to a temporary file, hashing it on the way, and validate it.
 
     Args:
-        file: Audio file to upload
-        db: Database session
+        file: Uploaded audio file
 
     Returns:
-        Audio file metadata
+        Tuple of (temporary path, SHA-256 checksum)
     """
     # Validate file extension
     file_ext = Path(file.filename).suffix.lower().lstrip('.')
@@ -39,53 +58,103 @@ async def upload_audio(
             detail=f"Unsupported file format. Allowed: {', '.join(settings.ALLOWED_EXTENSIONS)}"
         )
 
-    # Save uploaded file temporarily
-    temp_path = Path(settings.STORAGE_PATH) / "temp" / file.filename
-    temp_path.parent.mkdir(parents=True, exist_ok=True)
+    # Save uploaded file temporarily next to its final location, so moving it
+    # into place is an atomic rename rather than a cross-filesystem copy
+    file_suffix = Path(file.filename).suffix
+    temp_path = audio_processor.raw_path / f".incoming-{uuid4().hex}{file_suffix}"
 
     try:
-        with temp_path.open("wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-
-        # Validate audio file
+        # Stream the upload to disk in fixed-size chunks without blocking the event loop,
+        # hashing each chunk as it is written so the file is never re-read
+        hasher = audio_processor.new_hasher()
+        async with aiofiles.open(temp_path, "wb") as buffer:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                hasher.update(chunk)
+                await buffer.write(chunk)
+        checksum = audio_processor.finalize_hash(hasher)
+
+        # Validate audio file (existence, size and extension only; cheap enough to run inline)
         is_valid, error_msg = audio_processor.validate_audio_file(str(temp_path))
         if not is_valid:
-            temp_path.unlink()
             raise HTTPException(status_code=400, detail=error_msg)
 
-        # Calculate checksum
-        checksum = audio_processor.calculate_checksum(str(temp_path))
+        return temp_path, checksum
+
+    except HTTPException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    except Exception as e:
+        temp_path.unlink(missing_ok=True)
+        raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
+
+
+def _store_upload(file: UploadFile, temp_path: Path, checksum: str, audio_info: Dict) -> AudioFile:
+    """
+    Move a received upload into permanent storage and build its database record.
+
+    Args:
+        file: Uploaded audio file
+        temp_path: Temporary path returned by _receive_upload
+        checksum: SHA-256 checksum of the file
+        audio_info: Metadata from AudioProcessor.get_audio_info
+
+    Returns:
+        Unsaved audio file record
+    """
+    final_path = audio_processor.raw_path / f"{checksum}{Path(file.filename).suffix}"
+    os.replace(temp_path, final_path)
+
+    return AudioFile(
+        filename=final_path.name,
+        original_filename=file.filename,
+        file_path=str(final_path),
+        file_size=final_path.stat().st_size,
+        duration_seconds=audio_info.get('duration'),
+        sample_rate=audio_info.get('sample_rate'),
+        channels=audio_info.get('channels'),
+        format=audio_info.get('format'),
+        source_type=SourceType.UPLOAD,
+        checksum=checksum
+    )
+
 
+@router.post("/upload", response_model=AudioFileResponse)
+async def upload_audio(
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Upload an audio file.
+
+    Args:
+        file: Audio file to upload
+        db: Database session
+
+    Returns:
+        Audio file metadata
+    """
+    temp_path, checksum = await _receive_upload(file)
+
+    try:
         # Check if file already exists (deduplication)
-        existing_file = db.query(AudioFile).filter(AudioFile.checksum == checksum).first()
+        existing_file = await db.scalar(
+            select(AudioFile).where(AudioFile.checksum == checksum).limit(1)
+        )
         if existing_file:
             temp_path.unlink()
             return existing_file
 
         # Get audio info
-        audio_info = audio_processor.get_audio_info(str(temp_path))
-
-        # Move to permanent storage
-        final_path = audio_processor.raw_path / f"{checksum}{Path(file.filename).suffix}"
-        shutil.move(str(temp_path), str(final_path))
-
-        # Create database record
-        audio_file = AudioFile(
-            filename=final_path.name,
-            original_filename=file.filename,
-            file_path=str(final_path),
-            file_size=final_path.stat().st_size,
-            duration_seconds=audio_info.get('duration'),
-            sample_rate=audio_info.get('sample_rate'),
-            channels=audio_info.get('channels'),
-            format=audio_info.get('format'),
-            source_type=SourceType.UPLOAD,
-            checksum=checksum
+        audio_info = await asyncio.get_running_loop().run_in_executor(
+            probe_executor, _probe_audio, str(temp_path)
         )
 
+        # Move to permanent storage and create database record
+        audio_file = _store_upload(file, temp_path, checksum, audio_info)
+
         db.add(audio_file)
-        db.commit()
-        db.refresh(audio_file)
+        await db.commit()
+        await db.refresh(audio_file)
 
         return audio_file
 
@@ -97,8 +166,73 @@ async def upload_audio(
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
 
+@router.post("/upload/batch", response_model=List[AudioFileResponse])
+async def upload_audio_batch(
+    files: List[UploadFile] = File(...),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Upload several audio files in one request.
+
+    Files are received one after another, then every new file is probed at
+    once on the probe worker pool, so ingest uses all CPU cores; records are
+    deduplicated with one query and inserted in one commit.
+
+    Args:
+        files: Audio files to upload
+        db: Database session
+
+    Returns:
+        Audio file metadata for each file, in upload order
+    """
+    received = []
+    try:
+        for file in files:
+            temp_path, checksum = await _receive_upload(file)
+            received.append((file, temp_path, checksum))
+
+        # Deduplicate against stored files and within the batch
+        existing = {
+            audio_file.checksum: audio_file
+            for audio_file in await db.scalars(
+                select(AudioFile).where(AudioFile.checksum.in_({checksum for _, _, checksum in received}))
+            )
+        }
+        new_uploads = {}
+        for file, temp_path, checksum in received:
+            if checksum in existing or checksum in new_uploads:
+                temp_path.unlink()
+            else:
+                new_uploads[checksum] = (file, temp_path)
+
+        # Probe every new file in parallel across the worker processes
+        loop = asyncio.get_running_loop()
+        audio_infos = await asyncio.gather(*(
+            loop.run_in_executor(probe_executor, _probe_audio, str(temp_path))
+            for _, temp_path in new_uploads.values()
+        ))
+
+        created = {
+            checksum: _store_upload(file, temp_path, checksum, audio_info)
+            for (checksum, (file, temp_path)), audio_info in zip(new_uploads.items(), audio_infos)
+        }
+        db.add_all(created.values())
+        await db.commit()
+
+        return [existing.get(checksum) or created[checksum] for _, _, checksum in received]
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
+    finally:
+        # Anything not moved into permanent storage is discarded
+        for _, temp_path, _ in received:
+            temp_path.unlink(missing_ok=True)
+
+
 @router.get("/{audio_id}", response_model=AudioFileResponse)
-def get_audio(audio_id: int, db: Session = Depends(get_db)):
+async def get_audio(audio_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Get audio file metadata.
 
@@ -109,7 +243,7 @@ def get_audio(audio_id: int, db: Session = Depends(get_db)):
     Returns:
         Audio file metadata
     """
-    audio_file = db.query(AudioFile).filter(AudioFile.id == audio_id).first()
+    audio_file = await db.get(AudioFile, audio_id)
     if not audio_file:
         raise HTTPException(status_code=404, detail="Audio file not found")
 
@@ -117,10 +251,10 @@ def get_audio(audio_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/", response_model=List[AudioFileResponse])
-def list_audio_files(
+async def list_audio_files(
     skip: int = 0,
     limit: int = 50,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     List all audio files.
@@ -133,12 +267,14 @@ def list_audio_files(
     Returns:
         List of audio file metadata
     """
-    audio_files = db.query(AudioFile).order_by(AudioFile.upload_date.desc()).offset(skip).limit(limit).all()
-    return audio_files
+    audio_files = await db.scalars(
+        select(AudioFile).order_by(AudioFile.upload_date.desc()).offset(skip).limit(limit)
+    )
+    return list(audio_files)
 
 
 @router.delete("/{audio_id}")
-def delete_audio(audio_id: int, db: Session = Depends(get_db)):
+async def delete_audio(audio_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Delete audio file and all associated data.
 
@@ -149,7 +285,8 @@ def delete_audio(audio_id: int, db: Session = Depends(get_db)):
     Returns:
         Success message
     """
-    audio_file = db.query(AudioFile).filter(AudioFile.id == audio_id).first()
+    # Load jobs up front so the cascade delete doesn't lazy-load them
+    audio_file = await db.get(AudioFile, audio_id, options=[selectinload(AudioFile.jobs)])
     if not audio_file:
         raise HTTPException(status_code=404, detail="Audio file not found")
 
@@ -159,7 +296,7 @@ def delete_audio(audio_id: int, db: Session = Depends(get_db)):
         file_path.unlink()
 
     # Delete from database (cascade will delete related records)
-    db.delete(audio_file)
-    db.commit()
+    await db.delete(audio_file)
+    await db.commit()
 
     return {"message": "Audio file deleted successfully"}
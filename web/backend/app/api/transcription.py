@@ -1,13 +1,24 @@
 """Transcription job API endpoints."""
 
-from typing import List, Optional
+import asyncio
+import base64
+import csv
+import hashlib
+import numpy as np
+import orjson
+from typing import AsyncIterator, List, Literal, Optional, Tuple
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import PlainTextResponse, JSONResponse, FileResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
-
-from ..database import get_db
+from celery import group
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
+from fastapi.responses import FileResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy import desc, or_, and_, select, update, func
+
+from ..core.cache import result_cache
+from ..database import AsyncSessionLocal, get_async_db
 from ..models import (
     ProcessingJob,
     AudioFile,
@@ -31,11 +42,31 @@ from ..tasks.transcription_tasks import process_transcription
 
 router = APIRouter(prefix="/api", tags=["transcription"])
 
+# Status filter values accepted by list_jobs
+_STATUS_MAP = {s.value: s for s in JobStatus}
+
+# Seconds between job-row reads in the progress event stream
+JOB_EVENTS_POLL_INTERVAL = 0.5
+
+# Seconds without a progress change after which the stream sends a keepalive comment,
+# so clients and proxies can tell a quiet job from a dead connection
+JOB_EVENTS_KEEPALIVE_INTERVAL = 15.0
+
+# Segment rows fetched, formatted and sent per chunk of a streamed export
+EXPORT_BATCH_ROWS = 1000
+
+# Job states after which the progress event stream ends
+_FINAL_STATUSES = (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+# Validate whole lists in one pydantic-core call instead of one model per row
+_JOB_LIST_ADAPTER = TypeAdapter(List[JobListItem])
+_SEGMENT_LIST_ADAPTER = TypeAdapter(List[TranscriptionSegmentResponse])
+
 
 @router.post("/transcribe", response_model=JobStatusResponse)
-def create_transcription_job(
+async def create_transcription_job(
     request: TranscriptionRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create a new transcription job.
@@ -48,7 +79,7 @@ def create_transcription_job(
         Job status information
     """
     # Validate audio file exists
-    audio_file = db.query(AudioFile).filter(AudioFile.id == request.audio_id).first()
+    audio_file = await db.get(AudioFile, request.audio_id)
     if not audio_file:
         raise HTTPException(status_code=404, detail="Audio file not found")
 
@@ -66,16 +97,16 @@ def create_transcription_job(
     )
 
     db.add(job)
-    db.commit()
-    db.refresh(job)
+    await db.commit()
+    await db.refresh(job)
 
-    # Queue transcription task
+    # Queue transcription task (the broker client is blocking)
     try:
-        process_transcription.delay(job.id)
+        await run_in_threadpool(process_transcription.delay, job.id)
     except Exception as e:
         job.status = JobStatus.FAILED
         job.error_message = f"Failed to queue task: {str(e)}"
-        db.commit()
+        await db.commit()
         raise HTTPException(status_code=500, detail=str(e))
 
     return JobStatusResponse(
@@ -90,22 +121,121 @@ def create_transcription_job(
     )
 
 
+@router.post("/transcribe/batch", response_model=List[JobStatusResponse])
+async def create_transcription_jobs_batch(
+    requests: List[TranscriptionRequest],
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Create several transcription jobs in one request.
+
+    Jobs are inserted in a single flush and queued as one Celery group, so the
+    DB and broker round trips are shared by the whole batch.
+
+    Args:
+        requests: Transcription request parameters, one per job
+        db: Database session
+
+    Returns:
+        Job status information for each created job, in request order
+    """
+    if not requests:
+        return []
+
+    # Validate all audio files exist with a single query
+    audio_ids = {r.audio_id for r in requests}
+    found_ids = set(await db.scalars(select(AudioFile.id).where(AudioFile.id.in_(audio_ids))))
+    missing_ids = audio_ids - found_ids
+    if missing_ids:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Audio file(s) not found: {', '.join(map(str, sorted(missing_ids)))}"
+        )
+
+    # Create job records
+    jobs = [
+        ProcessingJob(
+            audio_file_id=r.audio_id,
+            status=JobStatus.QUEUED,
+            model_name=r.model,
+            language_hint=r.language_hint,
+            enable_diarization=r.enable_diarization,
+            enable_translation=r.enable_translation,
+            target_language=r.target_language,
+            chunk_duration=r.chunk_duration,
+            progress_percent=0.0
+        )
+        for r in requests
+    ]
+    db.add_all(jobs)
+    await db.flush()
+
+    responses = [
+        JobStatusResponse(
+            job_id=job.id,
+            status=job.status.value,
+            progress=job.progress_percent,
+            current_step=job.current_step,
+            error_message=job.error_message,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            completed_at=job.completed_at
+        )
+        for job in jobs
+    ]
+    job_ids = [job.id for job in jobs]
+    await db.commit()
+
+    # Queue all transcription tasks over one broker connection
+    try:
+        await run_in_threadpool(
+            group(process_transcription.s(job_id) for job_id in job_ids).apply_async
+        )
+    except Exception as e:
+        await db.execute(
+            update(ProcessingJob)
+            .where(ProcessingJob.id.in_(job_ids))
+            .values(status=JobStatus.FAILED, error_message=f"Failed to queue task: {str(e)}")
+        )
+        await db.commit()
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return responses
+
+
 @router.get("/jobs/{job_id}", response_model=JobStatusResponse)
-def get_job_status(job_id: int, db: Session = Depends(get_db)):
+async def get_job_status(
+    job_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
+):
     """
     Get job status and progress.
 
+    Returns 304 Not Modified when the client's If-None-Match matches the
+    current status ETag.
+
     Args:
         job_id: Job ID
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for the ETag header)
         db: Database session
 
     Returns:
         Job status information
     """
-    job = db.query(ProcessingJob).filter(ProcessingJob.id == job_id).first()
+    job = await db.get(ProcessingJob, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
+    etag = _make_etag(
+        job.id, job.status.value, job.progress_percent, job.current_step, job.completed_at
+    )
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
     return JobStatusResponse(
         job_id=job.id,
         status=job.status.value,
@@ -118,64 +248,191 @@ def get_job_status(job_id: int, db: Session = Depends(get_db)):
     )
 
 
+@router.get("/jobs/{job_id}/events")
+async def stream_job_events(job_id: int):
+    """
+    Stream job progress as server-sent events until the job finishes.
+
+    An event is sent whenever status, progress or step changes, so clients
+    see each transition without polling get_job_status themselves. While
+    nothing changes, a keepalive comment is sent every
+    JOB_EVENTS_KEEPALIVE_INTERVAL seconds.
+
+    Args:
+        job_id: Job ID
+
+    Returns:
+        text/event-stream of job status objects
+    """
+    # Not a get_async_db dependency: its session would only be closed once
+    # the stream ends, holding a pooled connection for the whole job
+    async with AsyncSessionLocal() as session:
+        if not await session.get(ProcessingJob, job_id):
+            raise HTTPException(status_code=404, detail="Job not found")
+
+    query = select(
+        ProcessingJob.status,
+        ProcessingJob.progress_percent,
+        ProcessingJob.current_step,
+        ProcessingJob.error_message
+    ).where(ProcessingJob.id == job_id)
+
+    async def events() -> AsyncIterator[str]:
+        loop = asyncio.get_running_loop()
+        last_state = None
+        last_sent = loop.time()
+        while True:
+            # Short-lived session per read, so the stream holds no connection while idle
+            async with AsyncSessionLocal() as session:
+                state = (await session.execute(query)).first()
+            if state is None:
+                return
+
+            if state != last_state:
+                last_state = state
+                payload = orjson.dumps({
+                    'job_id': job_id,
+                    'status': state.status.value,
+                    'progress': state.progress_percent,
+                    'current_step': state.current_step,
+                    'error_message': state.error_message
+                })
+                yield f"data: {payload.decode()}\n\n"
+                last_sent = loop.time()
+            elif loop.time() - last_sent >= JOB_EVENTS_KEEPALIVE_INTERVAL:
+                yield ": keepalive\n\n"
+                last_sent = loop.time()
+
+            if state.status in _FINAL_STATUSES:
+                return
+            await asyncio.sleep(JOB_EVENTS_POLL_INTERVAL)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # Disable proxy buffering so each event reaches the client immediately
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/jobs/{job_id}/result", response_model=TranscriptionResultResponse)
-def get_transcription_result(job_id: int, db: Session = Depends(get_db)):
+async def get_transcription_result(
+    job_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
+):
     """
     Get complete transcription result.
 
+    Completed results are immutable, so they are served from an in-process
+    LRU cache and tagged with an ETag; a matching If-None-Match yields 304.
+
     Args:
         job_id: Job ID
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for the ETag header)
         db: Database session
 
     Returns:
         Complete transcription with segments, speakers, and languages
     """
-    job = db.query(ProcessingJob).filter(ProcessingJob.id == job_id).first()
-    if not job:
+    etag, result = await _get_transcription_result(job_id, db)
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return result
+
+
+async def _get_transcription_result(job_id: int, db: AsyncSession) -> Tuple[str, TranscriptionResultResponse]:
+    """
+    Build (or fetch from cache) a completed job's result and its ETag.
+
+    The job's status and completion time are always read first and key the
+    cache, so a job that is rerun or deleted never serves a stale result.
+
+    Args:
+        job_id: Job ID
+        db: Database session
+
+    Returns:
+        Tuple of (etag, result)
+    """
+    state = (await db.execute(
+        select(ProcessingJob.status, ProcessingJob.completed_at).where(ProcessingJob.id == job_id)
+    )).first()
+    if state is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    if job.status != JobStatus.COMPLETED:
+    if state.status != JobStatus.COMPLETED:
         raise HTTPException(
             status_code=400,
-            detail=f"Job not completed yet. Status: {job.status.value}"
+            detail=f"Job not completed yet. Status: {state.status.value}"
         )
 
-    # Get segments
-    segments = db.query(TranscriptionSegment).filter(
-        TranscriptionSegment.job_id == job_id
-    ).order_by(TranscriptionSegment.chunk_index).all()
+    cache_key = (job_id, state.status, state.completed_at)
+    cached = result_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Load the job together with all of its result rows in one batch of queries:
+    # the many-to-one audio file is joined in, one-to-many children use IN queries
+    job = await db.scalar(
+        select(ProcessingJob)
+        .options(
+            joinedload(ProcessingJob.audio_file),
+            selectinload(ProcessingJob.segments),
+            selectinload(ProcessingJob.translations),
+        )
+        .where(ProcessingJob.id == job_id)
+    )
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
 
-    # Get speakers
-    speakers = db.query(Speaker).filter(Speaker.job_id == job_id).all()
+    segments = job.segments  # ordered by chunk_index
 
-    # Get detected languages
-    languages = db.query(DetectedLanguage).filter(DetectedLanguage.job_id == job_id).all()
+    # Speakers and languages only feed plain response fields, so skip the ORM objects
+    speakers = (await db.execute(
+        select(
+            Speaker.id,
+            Speaker.speaker_label,
+            Speaker.custom_name,
+            Speaker.total_speaking_time,
+            Speaker.num_segments
+        )
+        .where(Speaker.job_id == job_id)
+        .order_by(Speaker.id)
+    )).all()
+    languages = (await db.execute(
+        select(
+            DetectedLanguage.language_code,
+            DetectedLanguage.language_name,
+            DetectedLanguage.confidence,
+            DetectedLanguage.time_percentage
+        )
+        .where(DetectedLanguage.job_id == job_id)
+        .order_by(DetectedLanguage.id)
+    )).all()
 
     # Create speaker label map
     speaker_map = {s.id: s.speaker_label for s in speakers}
 
     # Get translation if available
-    translation = db.query(Translation).filter(Translation.job_id == job_id).first()
+    translation = job.translations[0] if job.translations else None
 
     # Build response
-    segment_responses = []
-    full_text_parts = []
-
-    for segment in segments:
-        speaker_label = None
-        if segment.speaker_id and segment.speaker_id in speaker_map:
-            speaker_label = speaker_map[segment.speaker_id]
-
-        segment_responses.append(TranscriptionSegmentResponse(
-            start_time=segment.start_time,
-            end_time=segment.end_time,
-            text=segment.text,
-            translated_text=segment.translated_text,
-            speaker_label=speaker_label,
-            confidence=segment.confidence
-        ))
-
-        full_text_parts.append(segment.text)
+    segment_responses = _SEGMENT_LIST_ADAPTER.validate_python([
+        {
+            'start_time': segment.start_time,
+            'end_time': segment.end_time,
+            'text': segment.text,
+            'translated_text': segment.translated_text,
+            'speaker_label': speaker_map.get(segment.speaker_id),
+            'confidence': segment.confidence
+        }
+        for segment in segments
+    ])
+    full_text_parts = [segment.text for segment in segments]
 
     # Compile full text
     full_text = " ".join(full_text_parts)
@@ -209,7 +466,7 @@ def get_transcription_result(job_id: int, db: Session = Depends(get_db)):
     if job.started_at and job.completed_at:
         processing_time = (job.completed_at - job.started_at).total_seconds()
 
-    return TranscriptionResultResponse(
+    result = TranscriptionResultResponse(
         job_id=job.id,
         status=job.status.value,
         full_text=full_text,
@@ -223,72 +480,109 @@ def get_transcription_result(job_id: int, db: Session = Depends(get_db)):
         target_language=job.target_language if job.enable_translation else None
     )
 
+    cached = (_make_etag(job.id, job.status.value, job.completed_at), result)
+    result_cache.set(cache_key, cached)
+    return cached
+
 
 @router.get("/jobs", response_model=JobListResponse)
-def list_jobs(
+async def list_jobs(
     status: Optional[str] = None,
     skip: int = 0,
     limit: int = 50,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     List transcription jobs with optional filtering.
 
+    Jobs are returned newest first. Pass the ``next_cursor`` of a response as
+    ``cursor`` to fetch the following page with an index range scan instead of
+    an OFFSET; ``skip`` is still honoured when no cursor is given.
+
     Args:
         status: Filter by job status (optional)
-        skip: Number of records to skip
+        skip: Number of records to skip (ignored when cursor is set)
         limit: Maximum number of records to return
+        cursor: Opaque keyset cursor from a previous page (optional)
+        include_total: Also count all matching jobs (extra COUNT query)
         db: Database session
 
     Returns:
         Paginated list of jobs
     """
-    query = db.query(ProcessingJob)
+    conditions = []
 
     # Filter by status if provided
     if status:
-        try:
-            status_enum = JobStatus(status)
-            query = query.filter(ProcessingJob.status == status_enum)
-        except ValueError:
+        status_enum = _STATUS_MAP.get(status)
+        if status_enum is None:
             raise HTTPException(status_code=400, detail=f"Invalid status: {status}")
+        conditions.append(ProcessingJob.status == status_enum)
+
+    # Only count when asked; COUNT(*) scans every matching row
+    total = None
+    if include_total:
+        total = await db.scalar(select(func.count(ProcessingJob.id)).where(*conditions))
+
+    # Select just the listed columns rather than whole job and audio file rows
+    query = (
+        select(
+            ProcessingJob.id.label("job_id"),
+            AudioFile.original_filename.label("audio_filename"),
+            ProcessingJob.status,
+            ProcessingJob.progress_percent.label("progress"),
+            ProcessingJob.model_name,
+            ProcessingJob.created_at,
+            AudioFile.duration_seconds.label("duration")
+        )
+        .join(AudioFile, ProcessingJob.audio_file_id == AudioFile.id)
+        .where(*conditions)
+        .order_by(desc(ProcessingJob.created_at), desc(ProcessingJob.id))
+    )
 
-    # Get total count
-    total = query.count()
+    # Get jobs with keyset (or offset) pagination, fetching one extra row to detect more pages
+    if cursor:
+        cursor_created_at, cursor_id = _decode_cursor(cursor)
+        query = query.where(or_(
+            ProcessingJob.created_at < cursor_created_at,
+            and_(ProcessingJob.created_at == cursor_created_at, ProcessingJob.id < cursor_id)
+        ))
+    else:
+        query = query.offset(skip)
+    jobs = (await db.execute(query.limit(limit + 1))).all()
 
-    # Get jobs with pagination
-    jobs = query.order_by(desc(ProcessingJob.created_at)).offset(skip).limit(limit).all()
+    next_cursor = None
+    if len(jobs) > limit:
+        jobs = jobs[:limit]
+        next_cursor = _encode_cursor(jobs[-1].created_at, jobs[-1].job_id)
 
-    # Build response items
-    items = []
-    for job in jobs:
-        items.append(JobListItem(
-            job_id=job.id,
-            audio_filename=job.audio_file.original_filename,
-            status=job.status.value,
-            progress=job.progress_percent,
-            model_name=job.model_name,
-            created_at=job.created_at,
-            duration=job.audio_file.duration_seconds
-        ))
+    # Build response items straight from the labelled rows
+    items = _JOB_LIST_ADAPTER.validate_python(jobs, from_attributes=True)
 
     return JobListResponse(
         items=items,
         total=total,
-        page=skip // limit + 1,
-        page_size=limit
+        page=skip // limit + 1 if not cursor else None,
+        page_size=limit,
+        next_cursor=next_cursor
     )
 
 
 @router.get("/jobs/{job_id}/export")
-def export_transcription(
+async def export_transcription(
     job_id: int,
-    format: str = Query("txt", regex="^(txt|json|srt|vtt|csv)$"),
-    db: Session = Depends(get_db)
+    format: Literal["txt", "json", "srt", "vtt", "csv"] = Query("txt"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Export transcription in various formats.
 
+    Text formats are streamed: segments are read from the database
+    EXPORT_BATCH_ROWS at a time and each batch is sent as one chunk, so long
+    transcripts start flushing immediately without being held in memory.
+
     Args:
         job_id: Job ID
         format: Export format (txt, json, srt, vtt, csv)
@@ -297,148 +591,156 @@ def export_transcription(
     Returns:
         Transcription file in requested format
     """
-    job = db.query(ProcessingJob).filter(ProcessingJob.id == job_id).first()
+    job = await db.get(ProcessingJob, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
     if job.status != JobStatus.COMPLETED:
         raise HTTPException(status_code=400, detail="Job not completed yet")
 
-    # Get segments
-    segments = db.query(TranscriptionSegment).filter(
-        TranscriptionSegment.job_id == job_id
-    ).order_by(TranscriptionSegment.chunk_index).all()
-
-    # Get speaker map
-    speakers = db.query(Speaker).filter(Speaker.job_id == job_id).all()
-    speaker_map = {s.id: s.speaker_label for s in speakers}
+    if format == "json":
+        # Get full result
+        _, result = await _get_transcription_result(job_id, db)
+        return Response(orjson.dumps(result.model_dump(mode="json")), media_type="application/json")
 
     # Get detected language and translation info
-    detected_lang = db.query(DetectedLanguage).filter(DetectedLanguage.job_id == job_id).first()
-    translation = db.query(Translation).filter(Translation.job_id == job_id).first()
+    detected_lang = await db.scalar(
+        select(DetectedLanguage).where(DetectedLanguage.job_id == job_id).limit(1)
+    )
+    translation = await db.scalar(
+        select(Translation).where(Translation.job_id == job_id).limit(1)
+    )
 
     if format == "txt":
         # Plain text format with header
-        text_parts = []
-
-        # Add header with language information
-        if detected_lang:
-            text_parts.append(f"Original Language: {detected_lang.language_name} ({detected_lang.language_code})")
-        if translation:
-            text_parts.append(f"Translated to: {translation.target_language.upper()}")
-        if detected_lang or translation:
-            text_parts.append("=" * 60)
-            text_parts.append("")
-
-        # Add segments
-        for segment in segments:
-            speaker_label = speaker_map.get(segment.speaker_id, "")
-            prefix = f"{speaker_label}: " if speaker_label else ""
-
-            # Original text
-            text_parts.append(f"{prefix}{segment.text}")
-
-            # Translation if available
-            if segment.translated_text:
-                text_parts.append(f"  [Translation: {segment.translated_text}]")
-
-            text_parts.append("")  # Empty line between segments
-
-        content = "\n".join(text_parts)
-        return PlainTextResponse(content, media_type="text/plain")
-
-    elif format == "json":
-        # Get full result
-        result = get_transcription_result(job_id, db)
-        return JSONResponse(content=result.dict())
+        async def txt_lines() -> AsyncIterator[List[str]]:
+            # Add header with language information
+            header = []
+            if detected_lang:
+                header.append(f"Original Language: {detected_lang.language_name} ({detected_lang.language_code})")
+            if translation:
+                header.append(f"Translated to: {translation.target_language.upper()}")
+            if detected_lang or translation:
+                header += ["=" * 60, ""]
+            yield header
+
+            # Add segments
+            async for segments in _export_batches(db, job_id):
+                lines = []
+                for segment in segments:
+                    speaker_label = segment.speaker_label or ""
+                    prefix = f"{speaker_label}: " if speaker_label else ""
+
+                    # Original text
+                    lines.append(f"{prefix}{segment.text}")
+
+                    # Translation if available
+                    if segment.translated_text:
+                        lines.append(f"  [Translation: {segment.translated_text}]")
+
+                    lines.append("")  # Empty line between segments
+                yield lines
+
+        return StreamingResponse(_join_batches(txt_lines()), media_type="text/plain")
 
     elif format == "srt":
         # SubRip subtitle format with translations
-        srt_parts = []
-        for idx, segment in enumerate(segments, 1):
-            start = _format_srt_time(segment.start_time)
-            end = _format_srt_time(segment.end_time)
-            text = segment.text
+        async def srt_blocks() -> AsyncIterator[List[str]]:
+            idx = 0
+            async for segments in _export_batches(db, job_id):
+                starts = _format_timestamps([seg.start_time for seg in segments], ",")
+                ends = _format_timestamps([seg.end_time for seg in segments], ",")
 
-            # Include translation if available
-            if segment.translated_text:
-                text = f"{text}\n[{segment.translated_text}]"
+                blocks = []
+                for segment, start, end in zip(segments, starts, ends):
+                    idx += 1
+                    text = segment.text
 
-            srt_parts.append(f"{idx}\n{start} --> {end}\n{text}\n")
+                    # Include translation if available
+                    if segment.translated_text:
+                        text = f"{text}\n[{segment.translated_text}]"
 
-        content = "\n".join(srt_parts)
-        return PlainTextResponse(content, media_type="text/plain")
+                    blocks.append(f"{idx}\n{start} --> {end}\n{text}\n")
+                yield blocks
+
+        return StreamingResponse(_join_batches(srt_blocks()), media_type="text/plain")
 
     elif format == "vtt":
         # WebVTT subtitle format with translations
-        vtt_parts = ["WEBVTT"]
+        async def vtt_blocks() -> AsyncIterator[List[str]]:
+            header = ["WEBVTT"]
+
+            # Add metadata
+            if detected_lang:
+                header.append(f"NOTE Original Language: {detected_lang.language_name}")
+            if translation:
+                header.append(f"NOTE Translated to: {translation.target_language.upper()}")
+            header.append("")
+            yield header
 
-        # Add metadata
-        if detected_lang:
-            vtt_parts.append(f"NOTE Original Language: {detected_lang.language_name}")
-        if translation:
-            vtt_parts.append(f"NOTE Translated to: {translation.target_language.upper()}")
-        vtt_parts.append("")
+            async for segments in _export_batches(db, job_id):
+                starts = _format_timestamps([seg.start_time for seg in segments], ".")
+                ends = _format_timestamps([seg.end_time for seg in segments], ".")
 
-        for segment in segments:
-            start = _format_vtt_time(segment.start_time)
-            end = _format_vtt_time(segment.end_time)
-            text = segment.text
+                blocks = []
+                for segment, start, end in zip(segments, starts, ends):
+                    text = segment.text
 
-            # Include translation if available
-            if segment.translated_text:
-                text = f"{text}\n[{segment.translated_text}]"
+                    # Include translation if available
+                    if segment.translated_text:
+                        text = f"{text}\n[{segment.translated_text}]"
 
-            vtt_parts.append(f"{start} --> {end}\n{text}\n")
+                    blocks.append(f"{start} --> {end}\n{text}\n")
+                yield blocks
 
-        content = "\n".join(vtt_parts)
-        return PlainTextResponse(content, media_type="text/vtt")
+        return StreamingResponse(_join_batches(vtt_blocks()), media_type="text/vtt")
 
     elif format == "csv":
-        # CSV format with translations
-        import csv
-        import io
-
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Add header with language info
-        if detected_lang and translation:
-            writer.writerow([f"Original Language: {detected_lang.language_name} ({detected_lang.language_code})"])
-            writer.writerow([f"Translated to: {translation.target_language.upper()}"])
-            writer.writerow([])
-
-        # Column headers
-        if translation:
-            writer.writerow(["Start Time", "End Time", "Speaker", "Original Text", "Translation"])
-        else:
-            writer.writerow(["Start Time", "End Time", "Speaker", "Text"])
-
-        # Data rows
-        for segment in segments:
-            speaker_label = speaker_map.get(segment.speaker_id, "")
-            if segment.translated_text:
-                writer.writerow([
-                    segment.start_time,
-                    segment.end_time,
-                    speaker_label,
-                    segment.text,
-                    segment.translated_text
-                ])
+        # CSV format with translations, one formatted row per chunk
+        writer = csv.writer(_EchoWriter())
+
+        async def csv_rows() -> AsyncIterator[List[str]]:
+            header = []
+            # Add header with language info
+            if detected_lang and translation:
+                header.append(writer.writerow([f"Original Language: {detected_lang.language_name} ({detected_lang.language_code})"]))
+                header.append(writer.writerow([f"Translated to: {translation.target_language.upper()}"]))
+                header.append(writer.writerow([]))
+
+            # Column headers
+            if translation:
+                header.append(writer.writerow(["Start Time", "End Time", "Speaker", "Original Text", "Translation"]))
             else:
-                writer.writerow([
-                    segment.start_time,
-                    segment.end_time,
-                    speaker_label,
-                    segment.text
-                ])
-
-        content = output.getvalue()
-        return PlainTextResponse(content, media_type="text/csv")
+                header.append(writer.writerow(["Start Time", "End Time", "Speaker", "Text"]))
+            yield header
+
+            # Data rows
+            async for segments in _export_batches(db, job_id):
+                rows = []
+                for segment in segments:
+                    speaker_label = segment.speaker_label or ""
+                    if segment.translated_text:
+                        rows.append(writer.writerow([
+                            segment.start_time,
+                            segment.end_time,
+                            speaker_label,
+                            segment.text,
+                            segment.translated_text
+                        ]))
+                    else:
+                        rows.append(writer.writerow([
+                            segment.start_time,
+                            segment.end_time,
+                            speaker_label,
+                            segment.text
+                        ]))
+                yield rows
+
+        return StreamingResponse(_join_batches(csv_rows(), separator=""), media_type="text/csv")
 
 
 @router.delete("/jobs/{job_id}")
-def delete_job(job_id: int, db: Session = Depends(get_db)):
+async def delete_job(job_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Delete a transcription job and all associated data.
 
@@ -449,30 +751,106 @@ def delete_job(job_id: int, db: Session = Depends(get_db)):
     Returns:
         Success message
     """
-    job = db.query(ProcessingJob).filter(ProcessingJob.id == job_id).first()
+    job = await db.get(ProcessingJob, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
     # Delete the job (cascade will delete segments, speakers, translations, etc.)
-    db.delete(job)
-    db.commit()
+    await db.delete(job)
+    await db.commit()
 
     return {"message": f"Job {job_id} deleted successfully"}
 
 
-def _format_srt_time(seconds: float) -> str:
-    """Format time for SRT format (HH:MM:SS,mmm)."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+async def _export_batches(db: AsyncSession, job_id: int) -> AsyncIterator[list]:
+    """
+    Stream the columns needed for text exports as batches of plain rows.
+
+    Selects only the rendered fields and LEFT JOINs the speaker label in SQL,
+    avoiding ORM hydration of segments and a separate speaker query; rows are
+    fetched EXPORT_BATCH_ROWS at a time instead of all at once.
+    """
+    stmt = (
+        select(
+            TranscriptionSegment.start_time,
+            TranscriptionSegment.end_time,
+            TranscriptionSegment.text,
+            TranscriptionSegment.translated_text,
+            Speaker.speaker_label,
+        )
+        .outerjoin(Speaker, Speaker.id == TranscriptionSegment.speaker_id)
+        .where(TranscriptionSegment.job_id == job_id)
+        .order_by(TranscriptionSegment.chunk_index)
+        .execution_options(yield_per=EXPORT_BATCH_ROWS)
+    )
+    result = await db.stream(stmt)
+    async for rows in result.partitions():
+        yield rows
+
+
+def _make_etag(*parts) -> str:
+    """Build a quoted ETag from the values that determine a response body."""
+    digest = hashlib.md5(":".join(map(str, parts)).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header matches etag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
 
 
-def _format_vtt_time(seconds: float) -> str:
-    """Format time for WebVTT format (HH:MM:SS.mmm)."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+class _EchoWriter:
+    """File-like object whose write() returns the value, for streaming csv.writer rows."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+async def _join_batches(batches: AsyncIterator[List[str]], separator: str = "\n") -> AsyncIterator[str]:
+    """Yield one string per batch of parts; together they equal separator.join(all parts)."""
+    first = True
+    async for parts in batches:
+        if not parts:
+            continue
+        body = separator.join(parts)
+        yield body if first else separator + body
+        first = False
+
+
+def _format_timestamps(seconds: List[float], decimal_separator: str) -> List[str]:
+    """
+    Format many times as HH:MM:SS<sep>mmm in one vectorized pass.
+
+    Args:
+        seconds: Times in seconds
+        decimal_separator: "," for SRT, "." for WebVTT
+
+    Returns:
+        Formatted timestamps, in input order
+    """
+    t = np.asarray(seconds, dtype=np.float64)
+    hours = (t // 3600).astype(np.int64)
+    minutes = ((t % 3600) // 60).astype(np.int64)
+    secs = (t % 60).astype(np.int64)
+    millis = ((t % 1) * 1000).astype(np.int64)
+    template = "{:02d}:{:02d}:{:02d}" + decimal_separator + "{:03d}"
+    return list(map(template.format, hours.tolist(), minutes.tolist(), secs.tolist(), millis.tolist()))
+
+
+def _encode_cursor(created_at: datetime, job_id: int) -> str:
+    """Encode a job list keyset cursor from the last row of a page."""
+    raw = f"{created_at.isoformat()}|{job_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a job list keyset cursor into (created_at, job_id)."""
+    try:
+        created_at, job_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(job_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
@@ -2,24 +2,22 @@
 
 from pathlib import Path
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..database import get_db
+from ..database import get_async_db
 from ..models import AudioFile, SourceType
 from ..schemas import YouTubeRequest, AudioFileResponse
-from ..services.youtube_downloader import YouTubeDownloader
-from ..services.audio_processor import AudioProcessor
-from ..core.config import settings
+from ..services import audio_processor, youtube_dl
 
 router = APIRouter(prefix="/api/youtube", tags=["youtube"])
-youtube_dl = YouTubeDownloader(output_dir=str(Path(settings.STORAGE_PATH) / "youtube"))
-audio_processor = AudioProcessor(storage_path=settings.STORAGE_PATH)
 
 
 @router.post("/extract", response_model=AudioFileResponse)
-def extract_youtube_audio(
+async def extract_youtube_audio(
     request: YouTubeRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Extract audio from YouTube video.
@@ -37,9 +35,19 @@ def extract_youtube_audio(
     if not youtube_dl.validate_url(url):
         raise HTTPException(status_code=400, detail="Invalid YouTube URL")
 
+    # Serve known videos without downloading them again
+    video_id = youtube_dl.extract_video_id(url)
+    if video_id:
+        cached_file = await db.scalar(
+            select(AudioFile).where(AudioFile.source_video_id == video_id).limit(1)
+        )
+        if cached_file and Path(cached_file.file_path).exists():
+            return cached_file
+
     try:
-        # Download audio from YouTube
-        result = youtube_dl.download_audio(url)
+        # Download audio from YouTube (yt-dlp and ffmpeg block, so run them in a worker thread)
+        result = await run_in_threadpool(youtube_dl.download_audio, url)
+        video_id = result.get('video_id') or video_id
 
         # Get audio file path
         audio_path = Path(result['file_path'])
@@ -48,18 +56,21 @@ def extract_youtube_audio(
             raise HTTPException(status_code=500, detail="Audio extraction failed")
 
         # Calculate checksum
-        checksum = audio_processor.calculate_checksum(str(audio_path))
+        checksum = await run_in_threadpool(audio_processor.calculate_checksum, str(audio_path))
 
         # Check if already exists
-        existing_file = db.query(AudioFile).filter(AudioFile.checksum == checksum).first()
+        existing_file = await db.scalar(
+            select(AudioFile).where(AudioFile.checksum == checksum).limit(1)
+        )
         if existing_file:
             # Check if the file paths are the same (same YouTube video re-downloaded)
             if str(audio_path) == existing_file.file_path:
                 # Same path means we just re-downloaded to the same location
                 # Update the record to ensure metadata is current, keep the file
                 existing_file.file_size = audio_path.stat().st_size
-                db.commit()
-                db.refresh(existing_file)
+                existing_file.source_video_id = existing_file.source_video_id or video_id
+                await db.commit()
+                await db.refresh(existing_file)
                 return existing_file
             # Verify the existing file still exists on disk
             elif Path(existing_file.file_path).exists():
@@ -71,12 +82,13 @@ def extract_youtube_audio(
                 existing_file.file_path = str(audio_path)
                 existing_file.filename = audio_path.name
                 existing_file.file_size = audio_path.stat().st_size
-                db.commit()
-                db.refresh(existing_file)
+                existing_file.source_video_id = existing_file.source_video_id or video_id
+                await db.commit()
+                await db.refresh(existing_file)
                 return existing_file
 
         # Get audio info
-        audio_info = audio_processor.get_audio_info(str(audio_path))
+        audio_info = await run_in_threadpool(audio_processor.get_audio_info, str(audio_path))
 
         # Create database record
         audio_file = AudioFile(
@@ -90,12 +102,13 @@ def extract_youtube_audio(
             format=audio_info.get('format'),
             source_type=SourceType.YOUTUBE,
             source_url=url,
+            source_video_id=video_id,
             checksum=checksum
         )
 
         db.add(audio_file)
-        db.commit()
-        db.refresh(audio_file)
+        await db.commit()
+        await db.refresh(audio_file)
 
         return audio_file
 
@@ -19,6 +19,8 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite:///./omniasr.db"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
 
     # Redis (for Celery)
     REDIS_URL: str = "redis://redis:6379/0"
@@ -34,13 +36,20 @@ class Settings(BaseSettings):
     # Processing
     DEFAULT_MODEL: str = "CTC_1B"  # Changed from LLM_7B for faster processing
     CHUNK_DURATION: int = 30
+    PERSIST_CHUNKS: bool = False  # Also write each chunk as a FLAC file under STORAGE_PATH/chunks (debugging only; ASR reads them from memory)
     ENABLE_DIARIZATION: bool = True
     MAX_AUDIO_DURATION: int = 36000  # 10 hours in seconds
+    AUDIO_CACHE_MAX_BYTES: int = 20 * 1024 * 1024 * 1024  # Decoded-audio cache size before LRU eviction
 
     # ASR Models
     MODEL_CACHE_DIR: str = "/root/.cache/fairseq2/assets"
     DEVICE: str = "cuda"  # Will fall back to CPU if CUDA not available
-    DTYPE: str = "float32"  # or "bfloat16"
+    DTYPE: str = "auto"  # bfloat16 on GPUs that support it, float32 weights with fp16 autocast on older GPUs, float32 on CPU; or "float32"/"bfloat16"/"int8_bfloat16"
+    TORCH_COMPILE: bool = False  # torch.compile the ASR model (and NLLB decoder with a static cache) on CUDA; slow start, faster after
+    ASR_BATCH_SIZE: int = 0  # Chunks per pipeline call; 0 sizes batches from free GPU memory (4 on CPU)
+    WARM_LOAD_MODELS: bool = True  # Load default ASR, VAD and translation models at Celery worker start, not on first task
+    WORKER_STARTUP_TIMEOUT: float = 900.0  # Seconds a Celery worker process may take to start (warm loads, compile) before it is killed
+    TRANSLATION_NUM_BEAMS: int = 2  # NLLB beam width; 1 is greedy (fastest), wider is slower for little gain
 
     # Security
     SECRET_KEY: str = "your-secret-key-change-in-production"
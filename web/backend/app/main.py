@@ -2,10 +2,14 @@
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
+import asyncio
 import json
-from typing import Dict, Set
+import os
+import orjson
+from typing import Dict, List, Tuple
 
 from .core.config import settings
 from .database import init_db
@@ -15,7 +19,8 @@ from .api import audio, youtube, transcription
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
-    description="Web interface for Omnilingual ASR transcription system"
+    description="Web interface for Omnilingual ASR transcription system",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -32,40 +37,117 @@ app.include_router(audio.router)
 app.include_router(youtube.router)
 app.include_router(transcription.router)
 
+# Messages buffered per WebSocket client before the oldest is dropped
+OUTBOX_SIZE = 32
+
+# Concurrent WebSocket subscribers allowed per job
+MAX_WS_PER_JOB = 16
+
+# Progress updates smaller than this many percentage points are not broadcast
+MIN_PROGRESS_STEP = 1.0
+
+# Large broadcasts yield to the event loop after every this many clients
+BROADCAST_CHUNK = 64
+
+# Heartbeat reply, serialized once
+PONG = orjson.dumps({"type": "pong"}).decode()
+
+# Storage subdirectories created on startup
+STORAGE_SUBDIRS = ("raw", "processed", "chunks", "temp", "youtube")
+
+
 # WebSocket connection manager
 class ConnectionManager:
     """Manage WebSocket connections for job progress updates."""
 
     def __init__(self):
-        self.active_connections: Dict[int, Set[WebSocket]] = {}
-
-    async def connect(self, job_id: int, websocket: WebSocket):
-        """Connect a WebSocket for a specific job."""
+        # job_id -> [(websocket, outbound queue)]; a writer task drains each queue.
+        # A list keeps the broadcast fan-out a plain sequential walk.
+        self.active_connections: Dict[int, List[Tuple[WebSocket, asyncio.Queue]]] = {}
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
+        # Last progress value broadcast per job, for jobs with subscribers
+        self.last_progress: Dict[int, float] = {}
+
+    async def connect(self, job_id: int, websocket: WebSocket) -> bool:
+        """
+        Connect a WebSocket for a specific job.
+
+        Returns:
+            False if the job already has MAX_WS_PER_JOB subscribers and the
+            socket was closed instead
+        """
         await websocket.accept()
-        if job_id not in self.active_connections:
-            self.active_connections[job_id] = set()
-        self.active_connections[job_id].add(websocket)
+        if len(self.active_connections.get(job_id, ())) >= MAX_WS_PER_JOB:
+            await websocket.close(code=1013)  # Try again later
+            return False
+
+        queue = asyncio.Queue(maxsize=OUTBOX_SIZE)
+        self.active_connections.setdefault(job_id, []).append((websocket, queue))
+        self._writers[websocket] = asyncio.create_task(self._writer(job_id, websocket, queue))
+        return True
 
     def disconnect(self, job_id: int, websocket: WebSocket):
         """Disconnect a WebSocket."""
         if job_id in self.active_connections:
-            self.active_connections[job_id].discard(websocket)
-            if not self.active_connections[job_id]:
+            connections = self.active_connections[job_id]
+            for i, (connection, _) in enumerate(connections):
+                if connection is websocket:
+                    del connections[i]
+                    break
+            if not connections:
                 del self.active_connections[job_id]
+                self.last_progress.pop(job_id, None)
+
+        writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
 
     async def broadcast(self, job_id: int, message: dict):
         """Broadcast message to all connections for a job."""
         if job_id in self.active_connections:
-            disconnected = set()
-            for connection in self.active_connections[job_id]:
-                try:
-                    await connection.send_json(message)
-                except Exception:
-                    disconnected.add(connection)
-
-            # Remove disconnected clients
-            for connection in disconnected:
-                self.active_connections[job_id].discard(connection)
+            # Skip progress updates that barely moved since the last one sent
+            if message.get("type") == "progress":
+                progress = message.get("progress", 0)
+                if abs(progress - self.last_progress.get(job_id, -MIN_PROGRESS_STEP)) < MIN_PROGRESS_STEP:
+                    return
+                self.last_progress[job_id] = progress
+
+            # Serialize once; each client's writer task does the sending
+            item = (message.get("type"), orjson.dumps(message).decode())
+            connections = self.active_connections[job_id]
+            for start in range(0, len(connections), BROADCAST_CHUNK):
+                if start:
+                    # Large fan-out: let other coroutines run between chunks
+                    await asyncio.sleep(0)
+                for _, queue in connections[start:start + BROADCAST_CHUNK]:
+                    try:
+                        queue.put_nowait(item)
+                    except asyncio.QueueFull:
+                        # Slow client: drop its oldest message to make room
+                        queue.get_nowait()
+                        queue.put_nowait(item)
+
+    async def _writer(self, job_id: int, websocket: WebSocket, queue: asyncio.Queue):
+        """Send queued messages to one client until it goes away."""
+        try:
+            while True:
+                batch = [await queue.get()]
+                while not queue.empty():
+                    batch.append(queue.get_nowait())
+
+                # Only the newest progress update in a backlog is worth sending
+                last_progress = max(
+                    (i for i, (msg_type, _) in enumerate(batch) if msg_type == "progress"),
+                    default=None
+                )
+                for i, (msg_type, payload) in enumerate(batch):
+                    if msg_type == "progress" and i != last_progress:
+                        continue
+                    await websocket.send_text(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.disconnect(job_id, websocket)
 
 
 manager = ConnectionManager()
@@ -80,13 +162,16 @@ async def websocket_endpoint(websocket: WebSocket, job_id: int):
         websocket: WebSocket connection
         job_id: Job ID to monitor
     """
-    await manager.connect(job_id, websocket)
+    if not await manager.connect(job_id, websocket):
+        return
     try:
         while True:
-            # Keep connection alive and handle incoming messages
-            data = await websocket.receive_text()
+            # Keep connection alive; any incoming frame, text or binary, is a heartbeat
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
             # Echo back for heartbeat
-            await websocket.send_json({"type": "pong"})
+            await websocket.send_text(PONG)
     except WebSocketDisconnect:
         manager.disconnect(job_id, websocket)
 
@@ -95,15 +180,21 @@ async def websocket_endpoint(websocket: WebSocket, job_id: int):
 async def startup_event():
     """Initialize application on startup."""
     # Create database tables
-    init_db()
-
-    # Ensure storage directories exist
-    storage_path = Path(settings.STORAGE_PATH)
-    (storage_path / "raw").mkdir(parents=True, exist_ok=True)
-    (storage_path / "processed").mkdir(parents=True, exist_ok=True)
-    (storage_path / "chunks").mkdir(parents=True, exist_ok=True)
-    (storage_path / "temp").mkdir(parents=True, exist_ok=True)
-    (storage_path / "youtube").mkdir(parents=True, exist_ok=True)
+    await init_db()
+
+    # Ensure storage directories exist, listing the base once instead of probing each
+    base = os.fspath(settings.STORAGE_PATH)
+    os.makedirs(base, exist_ok=True)
+    existing = {entry.name for entry in os.scandir(base) if entry.is_dir()}
+    for subdir in STORAGE_SUBDIRS:
+        if subdir not in existing:
+            os.makedirs(os.path.join(base, subdir), exist_ok=True)
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release worker processes on shutdown."""
+    audio.probe_executor.shutdown(wait=False, cancel_futures=True)
 
 
 @app.get("/")
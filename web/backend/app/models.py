@@ -12,6 +12,7 @@ from sqlalchemy import (
     Text,
     Boolean,
     Enum,
+    Index,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
@@ -50,6 +51,7 @@ class AudioFile(Base):
     format = Column(String(50), nullable=True)
     source_type = Column(Enum(SourceType), nullable=False, default=SourceType.UPLOAD)
     source_url = Column(String(1024), nullable=True)
+    source_video_id = Column(String(32), nullable=True, index=True)  # e.g., YouTube video ID
     checksum = Column(String(64), nullable=False, unique=True, index=True)  # SHA-256
     upload_date = Column(DateTime, default=datetime.utcnow, nullable=False)
 
@@ -60,6 +62,12 @@ class AudioFile(Base):
 class ProcessingJob(Base):
     """Transcription processing job."""
     __tablename__ = "processing_jobs"
+    __table_args__ = (
+        # Dashboard listing: filter by status, newest first
+        Index("ix_job_status_created", "status", "created_at"),
+        # Unfiltered listing: keyset pages on (created_at, id), newest first
+        Index("ix_job_created_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     audio_file_id = Column(Integer, ForeignKey("audio_files.id", ondelete="CASCADE"), nullable=False)
@@ -79,7 +87,12 @@ class ProcessingJob(Base):
 
     # Relationships
     audio_file = relationship("AudioFile", back_populates="jobs")
-    segments = relationship("TranscriptionSegment", back_populates="job", cascade="all, delete-orphan")
+    segments = relationship(
+        "TranscriptionSegment",
+        back_populates="job",
+        cascade="all, delete-orphan",
+        order_by="TranscriptionSegment.chunk_index",
+    )
     speakers = relationship("Speaker", back_populates="job", cascade="all, delete-orphan")
     languages = relationship("DetectedLanguage", back_populates="job", cascade="all, delete-orphan")
     translations = relationship("Translation", back_populates="job", cascade="all, delete-orphan")
@@ -88,6 +101,10 @@ class ProcessingJob(Base):
 class TranscriptionSegment(Base):
     """Individual transcribed audio segment."""
     __tablename__ = "transcription_segments"
+    __table_args__ = (
+        # Result/export queries: all segments of a job in chunk order
+        Index("ix_seg_job_chunk", "job_id", "chunk_index"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     job_id = Column(Integer, ForeignKey("processing_jobs.id", ondelete="CASCADE"), nullable=False)
@@ -110,7 +127,7 @@ class Speaker(Base):
     __tablename__ = "speakers"
 
     id = Column(Integer, primary_key=True, index=True)
-    job_id = Column(Integer, ForeignKey("processing_jobs.id", ondelete="CASCADE"), nullable=False)
+    job_id = Column(Integer, ForeignKey("processing_jobs.id", ondelete="CASCADE"), nullable=False, index=True)
     speaker_label = Column(String(50), nullable=False)  # e.g., "SPEAKER_00"
     custom_name = Column(String(100), nullable=True)  # User-assigned name
     total_speaking_time = Column(Float, default=0.0, nullable=False)  # seconds
@@ -126,7 +143,7 @@ class DetectedLanguage(Base):
     __tablename__ = "detected_languages"
 
     id = Column(Integer, primary_key=True, index=True)
-    job_id = Column(Integer, ForeignKey("processing_jobs.id", ondelete="CASCADE"), nullable=False)
+    job_id = Column(Integer, ForeignKey("processing_jobs.id", ondelete="CASCADE"), nullable=False, index=True)
     language_code = Column(String(10), nullable=False)  # ISO 639-3
     language_name = Column(String(100), nullable=False)
     confidence = Column(Float, nullable=False)
@@ -141,7 +158,7 @@ class Translation(Base):
     __tablename__ = "translations"
 
     id = Column(Integer, primary_key=True, index=True)
-    job_id = Column(Integer, ForeignKey("processing_jobs.id", ondelete="CASCADE"), nullable=False)
+    job_id = Column(Integer, ForeignKey("processing_jobs.id", ondelete="CASCADE"), nullable=False, index=True)
     source_language = Column(String(10), nullable=False)  # ISO 639-3 source language
     target_language = Column(String(10), nullable=False)  # ISO 639-3 target language
     full_translated_text = Column(Text, nullable=False)  # Complete translated text
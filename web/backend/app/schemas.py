@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 
 # ============================================================================
@@ -33,8 +33,7 @@ class AudioFileResponse(AudioFileBase):
     id: int
     upload_date: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============================================================================
@@ -72,8 +71,7 @@ class JobStatusResponse(BaseModel):
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============================================================================
@@ -88,8 +86,7 @@ class SpeakerInfo(BaseModel):
     total_speaking_time: float
     num_segments: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class LanguageInfo(BaseModel):
@@ -99,8 +96,7 @@ class LanguageInfo(BaseModel):
     confidence: float
     time_percentage: float
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TranscriptionSegmentResponse(BaseModel):
@@ -112,8 +108,7 @@ class TranscriptionSegmentResponse(BaseModel):
     speaker_label: Optional[str] = None
     confidence: Optional[float] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TranscriptionResultResponse(BaseModel):
@@ -130,8 +125,7 @@ class TranscriptionResultResponse(BaseModel):
     translation_enabled: bool = False
     target_language: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============================================================================
@@ -148,16 +142,16 @@ class JobListItem(BaseModel):
     created_at: datetime
     duration: Optional[float] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class JobListResponse(BaseModel):
     """Paginated job list response."""
     items: List[JobListItem]
-    total: int
-    page: int
+    total: Optional[int] = None  # Only computed when include_total=true
+    page: Optional[int] = None  # Only set for offset pagination
     page_size: int
+    next_cursor: Optional[str] = None  # Pass as cursor to fetch the next page
 
 
 # ============================================================================
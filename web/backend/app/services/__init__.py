@@ -1 +1,11 @@
 """Service layer modules."""
+
+from pathlib import Path
+
+from ..core.config import settings
+from .audio_processor import AudioProcessor
+from .youtube_downloader import YouTubeDownloader
+
+# Shared service instances, so caches live in one place per process
+audio_processor = AudioProcessor(storage_path=settings.STORAGE_PATH)
+youtube_dl = YouTubeDownloader(output_dir=str(Path(settings.STORAGE_PATH) / "youtube"))
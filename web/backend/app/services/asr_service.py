@@ -2,11 +2,20 @@
 
 import sys
 import os
+import re
+import gc
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional, Union
+from types import MappingProxyType
+from typing import Iterator, List, Dict, Optional, Tuple, Union
 import numpy as np
 import torch
 
+from ..core.config import settings
+from .onnx_asr import OnnxCTCModel, onnx_model_available
+
 # Add parent repo to path to import omnilingual_asr
 # In Docker: /app/repo/src contains omnilingual_asr
 repo_path = Path("/app/repo/src")
@@ -22,6 +31,245 @@ except ImportError:
     ASRInferencePipeline = None
     Wav2Vec2LlamaBeamSearchConfig = None
 
+# Chunk lengths (seconds) compiled ahead of time when TORCH_COMPILE is on
+WARMUP_CHUNK_SECONDS = (10, 20, 30, 40)
+
+# Rough peak GPU activation memory per second of batched audio, by model size
+_ACTIVATION_BYTES_PER_SECOND = MappingProxyType({
+    '300M': 8 * 1024 * 1024,
+    '1B': 16 * 1024 * 1024,
+    '3B': 32 * 1024 * 1024,
+    '7B': 64 * 1024 * 1024,
+})
+
+# Share of free VRAM an automatically sized batch may use, and its upper bound
+BATCH_VRAM_FRACTION = 0.5
+MAX_AUTO_BATCH_SIZE = 32
+
+# Batch size when ASR_BATCH_SIZE is 0 but batches can't be sized from free VRAM
+# (CPU / ONNX Runtime)
+DEFAULT_BATCH_SIZE = 4
+
+# Clips in flight when a failed batch is retried clip by clip: one can be
+# preprocessed while the other runs, hiding per-call launch latency
+FALLBACK_WORKERS = 2
+
+# Torch dtype for each supported DTYPE setting
+_DTYPE_MAP = MappingProxyType({
+    'float32': torch.float32,
+    'bfloat16': torch.bfloat16,
+    'int8_bfloat16': torch.bfloat16  # Linear weights then quantized to int8
+})
+
+# Projections kept in bf16 under int8_bfloat16 (output heads are accuracy-sensitive)
+INT8_SKIP_MODULES = ('final_proj', 'lm_head')
+
+# Display metadata per model for get_model_info
+_MODEL_INFO = MappingProxyType({
+    'LLM_7B': {
+        'size': '7B parameters',
+        'type': 'LLM',
+        'quality': 'Best',
+        'speed': 'Slow',
+        'description': 'Highest quality transcription'
+    },
+    'LLM_3B': {
+        'size': '3B parameters',
+        'type': 'LLM',
+        'quality': 'Very Good',
+        'speed': 'Medium',
+        'description': 'Balanced quality and speed'
+    },
+    'LLM_1B': {
+        'size': '1B parameters',
+        'type': 'LLM',
+        'quality': 'Good',
+        'speed': 'Fast',
+        'description': 'Good quality, faster processing'
+    },
+    'CTC_1B': {
+        'size': '1B parameters',
+        'type': 'CTC',
+        'quality': 'Good',
+        'speed': 'Very Fast',
+        'description': 'Fast transcription, good for real-time'
+    },
+})
+
+_UNKNOWN_MODEL_INFO = MappingProxyType({
+    'size': 'Unknown',
+    'type': 'Unknown',
+    'quality': 'Unknown',
+    'speed': 'Unknown',
+    'description': 'Model information not available'
+})
+
+# Let float32 matmuls and convolutions use TF32 tensor cores on Ampere and newer GPUs
+torch.backends.cuda.matmul.allow_tf32 = True
+torch.backends.cudnn.allow_tf32 = True
+torch.set_float32_matmul_precision('high')
+
+
+def _resolve_dtype(dtype: str, device: str) -> str:
+    """
+    Resolve the 'auto' dtype to bfloat16 on GPUs that support it, else float32.
+
+    Args:
+        dtype: Requested data type ('auto', 'float32', 'bfloat16' or 'int8_bfloat16')
+        device: Device the model will run on
+
+    Returns:
+        Concrete data type name
+    """
+    if dtype == 'int8_bfloat16' and device != 'cuda':
+        # bitsandbytes int8 matmuls are CUDA-only
+        return 'float32'
+    if dtype != 'auto':
+        return dtype
+    if device == 'cuda' and torch.cuda.get_device_capability()[0] >= 8 and torch.cuda.is_bf16_supported():
+        return 'bfloat16'
+    return 'float32'
+
+
+# Serializes first loads so concurrent callers don't load the same model twice
+_pipeline_lock = threading.Lock()
+
+# Compiled pipelines already warmed up, by (model, device, dtype, autocast dtype)
+_warmed_up = set()
+
+# Settings of the pipeline currently held by _get_pipeline
+_pipeline_key = None
+
+
+@lru_cache(maxsize=1)
+def _get_pipeline(model_name: str, device: str, dtype: str, compile_model: bool = False) -> "ASRInferencePipeline":
+    """
+    Load an ASR inference pipeline, shared by every service with the same config.
+
+    Args:
+        model_name: Model name (e.g., 'LLM_7B', 'CTC_1B')
+        device: Device to use ('cuda' or 'cpu')
+        dtype: Data type ('float32', 'bfloat16' or 'int8_bfloat16')
+        compile_model: Wrap the model in torch.compile (CUDA only)
+
+    Returns:
+        Loaded inference pipeline
+    """
+    # Get full model name
+    full_model_name = ASRService.MODEL_MAP.get(model_name, model_name)
+
+    # Convert dtype string to torch dtype
+    torch_dtype = _DTYPE_MAP.get(dtype, torch.float32)
+
+    # Configure beam search with more aggressive repetition detection
+    # for LLM models to prevent repetition loops
+    beam_search_config = None
+    if 'LLM' in model_name and Wav2Vec2LlamaBeamSearchConfig is not None:
+        beam_search_config = Wav2Vec2LlamaBeamSearchConfig(
+            nbest=1,
+            length_norm=False,
+            # More aggressive compression detection to prevent repetition loops
+            compression_window=50,  # Smaller window (default: 100)
+            compression_threshold=2.5,  # Lower threshold = more sensitive (default: 4.0)
+        )
+
+    # Initialize pipeline
+    pipeline = ASRInferencePipeline(
+        model_card=full_model_name,
+        device=device,
+        dtype=torch_dtype,
+        beam_search_config=beam_search_config,
+    )
+
+    if dtype == 'int8_bfloat16' and hasattr(pipeline, 'model'):
+        _quantize_linear_int8(pipeline.model)
+
+    # Chunks share a fixed target duration, so input shapes barely vary; compiling
+    # with CUDA graphs ("reduce-overhead") removes most per-kernel launch cost
+    if compile_model and device == 'cuda' and hasattr(pipeline, 'model'):
+        try:
+            pipeline.model = torch.compile(pipeline.model, mode="reduce-overhead", fullgraph=False)
+        except Exception as e:
+            print(f"torch.compile unavailable, running eager: {str(e)}")
+
+    return pipeline
+
+
+def _quantize_linear_int8(model: torch.nn.Module):
+    """
+    Swap linear projections for bitsandbytes int8 layers in place.
+
+    Weights are stored as int8 while activations stay bf16 (LLM.int8 with
+    outlier threshold 6.0), roughly halving the weight memory of bf16.
+
+    Args:
+        model: Model loaded in bf16 on CUDA
+    """
+    import bitsandbytes as bnb
+
+    for parent_name, parent in list(model.named_modules()):
+        for name, child in list(parent.named_children()):
+            full_name = f"{parent_name}.{name}" if parent_name else name
+            weight = getattr(child, 'weight', None)
+            # torch.nn.Linear or fairseq2's Linear projection
+            if (
+                type(child).__name__ != 'Linear'
+                or not isinstance(weight, torch.Tensor)
+                or weight.dim() != 2
+                or any(skip in full_name for skip in INT8_SKIP_MODULES)
+            ):
+                continue
+
+            out_features, in_features = weight.shape
+            bias = getattr(child, 'bias', None)
+            quantized = bnb.nn.Linear8bitLt(
+                in_features,
+                out_features,
+                bias=bias is not None,
+                has_fp16_weights=False,
+                threshold=6.0
+            )
+            quantized.weight = bnb.nn.Int8Params(weight.data.cpu(), requires_grad=False, has_fp16_weights=False)
+            if bias is not None:
+                quantized.bias = torch.nn.Parameter(bias.data, requires_grad=False)
+            # Moving to CUDA performs the int8 quantization
+            setattr(parent, name, quantized.to(weight.device))
+
+
+@lru_cache(maxsize=4)
+def _get_onnx_model(full_model_name: str) -> OnnxCTCModel:
+    """Load a quantized CTC model, shared by every service using it."""
+    return OnnxCTCModel(full_model_name)
+
+
+@lru_cache(maxsize=8)
+def _repetition_patterns(max_repeats: int) -> List[Tuple[int, re.Pattern]]:
+    """
+    Compile detectors for a 1-10 word phrase repeated more than max_repeats times.
+
+    Args:
+        max_repeats: Maximum number of times a phrase may appear consecutively
+
+    Returns:
+        (phrase length, pattern) pairs: 2-10 words shortest first, then single words
+    """
+    return [
+        (length, re.compile(r'(?<!\S)(\S+(?: \S+){%d})(?: \1(?!\S)){%d,}' % (length - 1, max_repeats)))
+        for length in [*range(2, 11), 1]
+    ]
+
+
+# Compile the default detectors at import rather than on the first transcription
+_repetition_patterns(3)
+
+
+def _longest_run(mask: np.ndarray) -> int:
+    """Length of the longest run of True values in a boolean array."""
+    if not mask.any():
+        return 0
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.astype(np.int8), [0]))))
+    return int((edges[1::2] - edges[::2]).max())
+
 
 class ASRService:
     """
@@ -46,62 +294,102 @@ class ASRService:
         self,
         model_name: str = 'LLM_7B',
         device: str = 'cuda',
-        dtype: str = 'float32'
+        dtype: str = 'auto',
+        compile_model: bool = False
     ):
         """
         Initialize ASR service.
 
+        CTC models on CPU run through an INT8 ONNX export instead of PyTorch
+        when one has been produced with ``python -m app.tools.quantize_asr``.
+
         Args:
             model_name: Model name (e.g., 'LLM_7B', 'CTC_1B')
             device: Device to use ('cuda' or 'cpu')
-            dtype: Data type ('float32' or 'bfloat16')
+            dtype: Data type ('auto', 'float32', 'bfloat16' or 'int8_bfloat16');
+                'auto' picks bfloat16 on compute capability 8.0+ GPUs (float32
+                weights with fp16 autocast on older ones), and
+                'int8_bfloat16' (CUDA only) stores linear weights as int8
+            compile_model: Compile the model with torch.compile on CUDA
         """
+        self.model_name = model_name
+        self.device = device if torch.cuda.is_available() else 'cpu'
+        self.dtype = _resolve_dtype(dtype, self.device)
+        self.compile_model = compile_model
+        # Run any float32 ops left in the model (e.g. feature frontends) under bf16 autocast too;
+        # under 'auto' on GPUs without bf16, weights stay float32 and activations run in fp16
+        self.autocast_dtype = None
+        if self.device == 'cuda' and self.dtype in ('bfloat16', 'int8_bfloat16'):
+            self.autocast_dtype = torch.bfloat16
+        elif self.device == 'cuda' and dtype == 'auto':
+            self.autocast_dtype = torch.float16
+
+        # CPU-only CTC: INT8 ONNX Runtime is several times faster than FP32 PyTorch
+        full_model_name = self.MODEL_MAP.get(model_name, model_name)
+        self.onnx_model = None
+        if self.device == 'cpu' and model_name.startswith('CTC_') and onnx_model_available(full_model_name):
+            self.onnx_model = _get_onnx_model(full_model_name)
+            self.pipeline = None
+            return
+
         if ASRInferencePipeline is None:
             raise ImportError(
                 "Could not import omnilingual_asr. "
                 "Make sure the repo is in the correct location."
             )
 
-        self.model_name = model_name
-        self.device = device if torch.cuda.is_available() else 'cpu'
-        self.dtype = dtype
-
         # Initialize pipeline
         self.pipeline = self._load_pipeline()
+        if hasattr(getattr(self.pipeline, 'model', None), '_orig_mod'):
+            self._warmup()
 
     def _load_pipeline(self) -> ASRInferencePipeline:
-        """Load ASR inference pipeline."""
-        # Get full model name
-        full_model_name = self.MODEL_MAP.get(self.model_name, self.model_name)
-
-        # Convert dtype string to torch dtype
-        dtype_map = {
-            'float32': torch.float32,
-            'bfloat16': torch.bfloat16
-        }
-        torch_dtype = dtype_map.get(self.dtype, torch.float32)
-
-        # Configure beam search with more aggressive repetition detection
-        # for LLM models to prevent repetition loops
-        beam_search_config = None
-        if 'LLM' in self.model_name and Wav2Vec2LlamaBeamSearchConfig is not None:
-            beam_search_config = Wav2Vec2LlamaBeamSearchConfig(
-                nbest=1,
-                length_norm=False,
-                # More aggressive compression detection to prevent repetition loops
-                compression_window=50,  # Smaller window (default: 100)
-                compression_threshold=2.5,  # Lower threshold = more sensitive (default: 4.0)
-            )
+        """
+        Load ASR inference pipeline (cached per model, device, dtype and compile flag).
 
-        # Initialize pipeline
-        pipeline = ASRInferencePipeline(
-            model_card=full_model_name,
-            device=self.device,
-            dtype=torch_dtype,
-            beam_search_config=beam_search_config,
-        )
+        A process keeps one pipeline, since each holds several GB of weights on
+        the GPU; loading one with other settings frees the previous one first.
+        """
+        global _pipeline_key
+        key = (self.model_name, self.device, self.dtype, self.compile_model)
+        with _pipeline_lock:
+            if _pipeline_key not in (None, key):
+                _get_pipeline.cache_clear()
+                _warmed_up.clear()
+                gc.collect()
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()
+            _pipeline_key = key
+            return _get_pipeline(*key)
+
+    def _warmup(self):
+        """
+        Compile and record CUDA graphs for the common chunk shapes up front.
 
-        return pipeline
+        reduce-overhead captures one graph per input shape and autocast state
+        on first use. Running silent clips through _run, at the usual chunk
+        lengths and the batch sizes jobs will use for them, moves that cost to
+        model load instead of the first jobs. Runs once per compiled pipeline
+        and autocast dtype.
+        """
+        key = (self.model_name, self.device, self.dtype, self.autocast_dtype)
+        with _pipeline_lock:
+            if key in _warmed_up:
+                return
+            _warmed_up.add(key)
+
+            try:
+                for seconds in WARMUP_CHUNK_SECONDS:
+                    clip = np.zeros(seconds * 16000, dtype=np.float32)
+                    # The size a job's full batches get: fixed, or what pick_batch_size chooses
+                    full_batch_size = settings.ASR_BATCH_SIZE or self.pick_batch_size([clip] * MAX_AUTO_BATCH_SIZE)
+                    for batch_size in sorted({1, full_batch_size}):
+                        # Two passes per shape: the first compiles, the second records the graph
+                        for _ in range(2):
+                            self._run([clip] * batch_size, None, batch_size)
+            except Exception as e:
+                # Shapes that weren't warmed up compile on first use instead
+                print(f"ASR warm-up failed: {str(e)}")
 
     @staticmethod
     def _clean_repetitions(text: str, max_repeats: int = 3) -> str:
@@ -126,54 +414,36 @@ class ASRService:
         if len(words) < 6:
             return text
 
-        # Try to find repeated patterns of different lengths (2-10 words)
-        cleaned = False
-        for pattern_len in range(2, min(11, len(words) // 3)):
-            i = 0
-            new_words = []
-            while i < len(words):
-                # Check if we have a repeating pattern starting at position i
-                pattern = words[i:i + pattern_len]
-                if len(pattern) < pattern_len:
-                    new_words.extend(words[i:])
-                    break
-
-                # Count how many times this pattern repeats
-                repeat_count = 1
-                j = i + pattern_len
-                while j + pattern_len <= len(words):
-                    if words[j:j + pattern_len] == pattern:
-                        repeat_count += 1
-                        j += pattern_len
-                    else:
-                        break
-
-                # If too many repeats, limit them
-                if repeat_count > max_repeats:
-                    # Keep only max_repeats occurrences
-                    for _ in range(max_repeats):
-                        new_words.extend(pattern)
-                    i = j
-                    cleaned = True
-                else:
-                    new_words.append(words[i])
-                    i += 1
-
-            if cleaned:
-                words = new_words
-                cleaned = False  # Reset for next pattern length
+        # A phrase of N words repeating shows up as a run of words equal to the
+        # word N positions later; compare word IDs to find which lengths repeat
+        vocab = {}
+        ids = np.fromiter((vocab.setdefault(w, len(vocab)) for w in words), dtype=np.int64, count=len(words))
 
+        # Collapse runs of a repeated 1-10 word phrase
         result = ' '.join(words)
-
-        # Also check for character-level repetitions (rare but possible)
-        # This catches cases like "...المتحدة المتحدة المتحدة..."
-        import re
-        # Find phrases repeated more than max_repeats times
-        result = re.sub(r'(\b\S+(?:\s+\S+){0,5}?\s*)(\1){' + str(max_repeats) + r',}',
-                       r'\1' * max_repeats, result)
+        for length, pattern in _repetition_patterns(max_repeats):
+            if length >= len(ids) or _longest_run(ids[length:] == ids[:-length]) < length * max_repeats:
+                continue
+            result = pattern.sub(lambda m: ' '.join([m.group(1)] * max_repeats), result)
 
         return result.strip()
 
+    def _run(self, audio_list: List, lang_list: Optional[List[str]], batch_size: int) -> List[str]:
+        """Run the INT8 ONNX model or the PyTorch pipeline on a list of clips."""
+        if self.onnx_model is not None:
+            return self.onnx_model.transcribe_batch(audio_list)
+
+        with torch.inference_mode(), torch.autocast(
+            'cuda',
+            dtype=self.autocast_dtype or torch.bfloat16,
+            enabled=self.autocast_dtype is not None
+        ):
+            return self.pipeline.transcribe(
+                audio_list,
+                lang=lang_list,
+                batch_size=batch_size
+            )
+
     def transcribe(
         self,
         audio: Union[str, np.ndarray, bytes],
@@ -204,11 +474,7 @@ class ASRService:
                 lang_list = [language] if language else None
 
             # Transcribe using the pipeline
-            results = self.pipeline.transcribe(
-                audio_list,
-                lang=lang_list,
-                batch_size=batch_size
-            )
+            results = self._run(audio_list, lang_list, batch_size)
 
             # For single audio, return first result
             if not isinstance(audio, (list, tuple)):
@@ -246,17 +512,115 @@ class ASRService:
             # Prepare language list
             lang_list = [language] * len(audio_list) if language else None
 
-            results = self.pipeline.transcribe(
-                audio_list,
-                lang=lang_list,
-                batch_size=batch_size
-            )
+            results = self._run(audio_list, lang_list, batch_size)
             # Clean up any repetition loops in results
             return [self._clean_repetitions(r) for r in results]
 
+        except torch.cuda.OutOfMemoryError:
+            # Let callers see OOM so they can retry with a smaller batch
+            raise
         except Exception as e:
             raise Exception(f"Batch transcription failed: {str(e)}")
 
+    def stream_transcribe(
+        self,
+        audio_list: List[Union[str, np.ndarray]],
+        language: Optional[str] = None,
+        batch_size: int = 4
+    ) -> Iterator[Tuple[int, List[str]]]:
+        """
+        Transcribe VAD chunks batch by batch, yielding each batch as it finishes.
+
+        A batch that runs out of GPU memory is retried at half the batch size
+        (which is kept for later batches), and a single clip that still does
+        comes back as an empty string; a batch that fails otherwise is retried
+        clip by clip, and clips that still fail come back as empty strings.
+
+        Args:
+            audio_list: List of audio file paths or numpy arrays, in time order
+            language: Optional language hint (e.g., 'eng_Latn', 'fra_Latn')
+            batch_size: Clips per pipeline call
+
+        Yields:
+            Tuple of (index of the batch's first clip, transcribed texts)
+        """
+        start = 0
+        while start < len(audio_list):
+            batch = audio_list[start:start + batch_size]
+            try:
+                texts = self.transcribe_batch(batch, language=language, batch_size=batch_size)
+            except torch.cuda.OutOfMemoryError:
+                if batch_size > 1:
+                    # Retry the same clips in smaller batches, and keep the smaller size
+                    torch.cuda.empty_cache()
+                    batch_size //= 2
+                    print(f"CUDA out of memory, retrying with batch size {batch_size}")
+                    continue
+                # Retrying the same clip in the same memory state would fail the same way
+                torch.cuda.empty_cache()
+                print(f"CUDA out of memory at batch size 1, chunk {start} left empty")
+                texts = [""] * len(batch)
+            except Exception as e:
+                print(f"Batch transcription failed: {str(e)}, falling back to sequential")
+                texts = self._transcribe_sequential(batch, start, language)
+            yield start, texts
+            start += len(batch)
+
+    def _transcribe_sequential(
+        self,
+        batch: List[Union[str, np.ndarray]],
+        start: int,
+        language: Optional[str]
+    ) -> List[str]:
+        """
+        Transcribe clips one per call; clips that fail come back as empty strings.
+
+        Up to FALLBACK_WORKERS calls overlap. A compiled model runs them one at a time,
+        since its CUDA graphs are recorded per thread.
+        """
+        def transcribe_one(idx: int, audio: Union[str, np.ndarray]) -> str:
+            try:
+                return self.transcribe(audio, language=language)
+            except Exception as e:
+                print(f"Error transcribing chunk {idx}: {str(e)}")
+                return ""
+
+        workers = 1 if self.compile_model else FALLBACK_WORKERS
+        if workers <= 1 or len(batch) <= 1:
+            return [transcribe_one(idx, audio) for idx, audio in enumerate(batch, start)]
+
+        # map keeps results in clip order however the calls finish
+        with ThreadPoolExecutor(max_workers=min(workers, len(batch))) as pool:
+            return list(pool.map(transcribe_one, range(start, start + len(batch)), batch))
+
+    def pick_batch_size(self, audio_list: List[Union[str, np.ndarray]], sr: int = 16000) -> int:
+        """
+        Choose how many clips to batch from free GPU memory and clip length.
+
+        Args:
+            audio_list: Clips to be transcribed
+            sr: Sample rate of numpy clips
+
+        Returns:
+            Batch size, between 1 and the number of clips
+        """
+        if not audio_list:
+            return 1
+        if self.onnx_model is not None or self.device != 'cuda':
+            return max(1, min(DEFAULT_BATCH_SIZE, len(audio_list)))
+
+        # Paths are chunk files of at most the longest warmed-up chunk length
+        mean_seconds = float(np.mean([
+            len(audio) / sr if isinstance(audio, np.ndarray) else WARMUP_CHUNK_SECONDS[-1]
+            for audio in audio_list
+        ]))
+        size = self.model_name.rsplit('_', 1)[-1]
+        bytes_per_clip = max(1.0, mean_seconds * _ACTIVATION_BYTES_PER_SECOND.get(size, _ACTIVATION_BYTES_PER_SECOND['7B']))
+
+        free_bytes, _ = torch.cuda.mem_get_info()
+        batch_size = int(free_bytes * BATCH_VRAM_FRACTION // bytes_per_clip)
+        return max(1, min(batch_size, MAX_AUTO_BATCH_SIZE, len(audio_list)))
+
     def detect_language(self, audio: Union[str, np.ndarray]) -> Dict:
         """
         Detect language from audio.
@@ -297,41 +661,4 @@ class ASRService:
         Returns:
             Dictionary with model information
         """
-        model_info = {
-            'LLM_7B': {
-                'size': '7B parameters',
-                'type': 'LLM',
-                'quality': 'Best',
-                'speed': 'Slow',
-                'description': 'Highest quality transcription'
-            },
-            'LLM_3B': {
-                'size': '3B parameters',
-                'type': 'LLM',
-                'quality': 'Very Good',
-                'speed': 'Medium',
-                'description': 'Balanced quality and speed'
-            },
-            'LLM_1B': {
-                'size': '1B parameters',
-                'type': 'LLM',
-                'quality': 'Good',
-                'speed': 'Fast',
-                'description': 'Good quality, faster processing'
-            },
-            'CTC_1B': {
-                'size': '1B parameters',
-                'type': 'CTC',
-                'quality': 'Good',
-                'speed': 'Very Fast',
-                'description': 'Fast transcription, good for real-time'
-            },
-        }
-
-        return model_info.get(model_name, {
-            'size': 'Unknown',
-            'type': 'Unknown',
-            'quality': 'Unknown',
-            'speed': 'Unknown',
-            'description': 'Model information not available'
-        })
+        return dict(_MODEL_INFO.get(model_name, _UNKNOWN_MODEL_INFO))
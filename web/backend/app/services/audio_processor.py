@@ -1,22 +1,32 @@
 """Audio processing service for format conversion and validation."""
 
 import os
+import sys
 import hashlib
+import mmap
+import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 import soundfile as sf
-import librosa
 import numpy as np
-from pydub import AudioSegment
 
 from ..core.config import settings
 
+# PyAV probes metadata in-process through libavformat; without it we shell out to ffprobe
+try:
+    import av
+except ImportError:
+    av = None
+
 
 class AudioProcessor:
     """Handle audio file processing and conversion."""
 
     SUPPORTED_FORMATS = settings.ALLOWED_EXTENSIONS
+    HASH_CHUNK_SIZE = 8 * 1024 * 1024  # 8 MiB reads when hashing files
+    MMAP_HASH_LIMIT = 1024 * 1024 * 1024  # Files up to 1 GiB are hashed through one mmap
 
     def __init__(self, storage_path: str = None):
         """
@@ -30,10 +40,39 @@ class AudioProcessor:
         self.raw_path = self.storage_path / "raw"
         self.processed_path = self.storage_path / "processed"
         self.chunks_path = self.storage_path / "chunks"
+        # Decoded audio keyed by content checksum and sample rate
+        self.cache_path = self.processed_path / "cache"
 
         self.raw_path.mkdir(exist_ok=True)
         self.processed_path.mkdir(exist_ok=True)
         self.chunks_path.mkdir(exist_ok=True)
+        self.cache_path.mkdir(exist_ok=True)
+
+    @staticmethod
+    def new_hasher():
+        """
+        Create an incremental hasher for file checksums.
+
+        Callers that already stream file contents (e.g. uploads) can update
+        this hasher chunk by chunk instead of re-reading the file afterwards.
+
+        Returns:
+            hashlib hash object
+        """
+        return hashlib.sha256()
+
+    @staticmethod
+    def finalize_hash(hasher) -> str:
+        """
+        Finalize an incremental hasher created by new_hasher().
+
+        Args:
+            hasher: Hash object returned by new_hasher()
+
+        Returns:
+            Hex string of the checksum
+        """
+        return hasher.hexdigest()
 
     def calculate_checksum(self, file_path: str) -> str:
         """
@@ -45,11 +84,26 @@ class AudioProcessor:
         Returns:
             Hex string of SHA-256 hash
         """
-        sha256 = hashlib.sha256()
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+            size = os.fstat(f.fileno()).st_size
+            if 0 < size <= self.MMAP_HASH_LIMIT and sys.maxsize > 2**32:
+                # Hash the whole file in a single native call over a read-only mapping
+                hasher = self.new_hasher()
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    hasher.update(mapped)
+                return self.finalize_hash(hasher)
+
+            if hasattr(hashlib, "file_digest"):
+                # Python 3.11+: reads into a reused buffer and hashes without Python-level looping
+                return hashlib.file_digest(f, "sha256").hexdigest()
+
+            # Older Pythons: same idea by hand, reading into one preallocated buffer
+            hasher = self.new_hasher()
+            buffer = bytearray(self.HASH_CHUNK_SIZE)
+            view = memoryview(buffer)
+            while size := f.readinto(buffer):
+                hasher.update(view[:size])
+        return self.finalize_hash(hasher)
 
     def validate_audio_file(self, file_path: str) -> Tuple[bool, Optional[str]]:
         """
@@ -79,7 +133,10 @@ class AudioProcessor:
 
     def get_audio_info(self, file_path: str) -> Dict:
         """
-        Extract audio file metadata using ffprobe.
+        Extract audio file metadata using PyAV (ffprobe if PyAV is missing).
+
+        Results are cached per (path, mtime, size), so probing an unchanged
+        file again skips the probe.
 
         Args:
             file_path: Path to audio file
@@ -88,6 +145,39 @@ class AudioProcessor:
             Dictionary with audio metadata
         """
         try:
+            stat = os.stat(file_path)
+        except OSError as e:
+            raise Exception(f"Failed to extract audio info: {str(e)}")
+
+        return dict(self._probe_audio_info(file_path, stat.st_mtime_ns, stat.st_size))
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _probe_audio_info(file_path: str, mtime_ns: int, size: int) -> Dict:
+        """Probe audio metadata; mtime_ns and size only key the cache."""
+        try:
+            if av is not None:
+                # Read container headers in-process (no ffprobe spawn or JSON decode)
+                with av.open(file_path, metadata_errors='ignore') as container:
+                    if not container.streams.audio:
+                        raise Exception("No audio stream found")
+                    stream = container.streams.audio[0]
+
+                    if container.duration is not None:
+                        duration = container.duration / av.time_base
+                    elif stream.duration is not None:
+                        duration = float(stream.duration * stream.time_base)
+                    else:
+                        duration = 0.0
+
+                    return {
+                        'duration': float(duration),
+                        'sample_rate': int(stream.codec_context.sample_rate or 0),
+                        'channels': int(stream.codec_context.channels or 1),
+                        'format': stream.codec_context.name or 'unknown',
+                        'bitrate': int(container.bit_rate or 0),
+                    }
+
             # Use ffprobe to get audio info
             cmd = [
                 'ffprobe',
@@ -139,18 +229,80 @@ class AudioProcessor:
             except Exception:
                 raise Exception(f"Failed to extract audio info: {str(e)}")
 
-    def convert_to_wav(self, input_path: str, output_path: str, target_sr: int = 16000) -> str:
+    def _cache_file(self, checksum: str, sr: int, suffix: str) -> Path:
+        """Path of a cached decode of the file with this checksum, touched on hit."""
+        path = self.cache_path / f"{checksum}_{sr}{suffix}"
+        if path.exists():
+            # Bump mtime so eviction drops least recently used entries first
+            os.utime(path)
+        return path
+
+    def _store_in_cache(self, source: str, cache_file: Path):
+        """Hard-link (or copy) a freshly decoded file into the cache, then evict."""
+        try:
+            os.link(source, cache_file)
+        except OSError:
+            try:
+                shutil.copyfile(source, cache_file)
+            except OSError:
+                return
+        self._evict_cache()
+
+    def _evict_cache(self):
+        """Delete least recently used cache entries beyond AUDIO_CACHE_MAX_BYTES."""
+        entries = []
+        total = 0
+        with os.scandir(self.cache_path) as it:
+            for entry in it:
+                if entry.is_file():
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+                    total += st.st_size
+
+        if total <= settings.AUDIO_CACHE_MAX_BYTES:
+            return
+
+        for _, size, path in sorted(entries):
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= settings.AUDIO_CACHE_MAX_BYTES:
+                break
+
+    def convert_to_wav(
+        self,
+        input_path: str,
+        output_path: str,
+        target_sr: int = 16000,
+        checksum: Optional[str] = None
+    ) -> str:
         """
         Convert audio file to WAV format (16kHz, mono, 16-bit PCM).
 
+        Conversions are cached by content checksum; converting the same audio
+        again returns the cached WAV instead of running ffmpeg.
+
         Args:
             input_path: Path to input audio file
             output_path: Path to output WAV file
             target_sr: Target sample rate (default 16000 Hz for ASR)
+            checksum: SHA-256 of the input, if already known
 
         Returns:
-            Path to converted WAV file
+            Path to converted WAV file (the cached copy on a cache hit)
         """
+        cache_file = self._cache_file(checksum or self.calculate_checksum(input_path), target_sr, '.wav')
+        if cache_file.exists():
+            return str(cache_file)
+
+        self._convert_to_wav(input_path, output_path, target_sr)
+        self._store_in_cache(output_path, cache_file)
+        return output_path
+
+    def _convert_to_wav(self, input_path: str, output_path: str, target_sr: int):
+        """Run the actual ffmpeg (or librosa fallback) conversion."""
         try:
             # Use ffmpeg for conversion (most reliable for all formats)
             cmd = [
@@ -167,30 +319,106 @@ class AudioProcessor:
             if result.returncode != 0:
                 raise Exception(f"ffmpeg conversion failed: {result.stderr}")
 
-            return output_path
-
         except Exception as e:
             # Fallback to librosa
             try:
+                import librosa
                 audio, sr = librosa.load(input_path, sr=target_sr, mono=True)
                 sf.write(output_path, audio, target_sr, subtype='PCM_16')
-                return output_path
             except Exception:
                 raise Exception(f"Audio conversion failed: {str(e)}")
 
-    def load_audio(self, file_path: str, sr: int = 16000) -> Tuple[np.ndarray, int]:
+    def load_audio(
+        self,
+        file_path: str,
+        sr: int = 16000,
+        checksum: Optional[str] = None
+    ) -> Tuple[np.ndarray, int]:
         """
         Load audio file as numpy array.
 
+        Files already at the target rate and mono are read as-is. Anything
+        else is decoded once and cached as .npy by content checksum, so
+        loading the same audio again memory-maps the cached array.
+
         Args:
             file_path: Path to audio file
             sr: Target sample rate
+            checksum: SHA-256 of the file, if already known
 
         Returns:
             Tuple of (audio_array, sample_rate)
         """
-        audio, sample_rate = librosa.load(file_path, sr=sr, mono=True)
-        return audio, sample_rate
+        # Already at the target rate and mono: read the samples directly, nothing to resample
+        try:
+            info = sf.info(file_path)
+        except Exception:
+            info = None
+        if info is not None and info.samplerate == sr and info.channels == 1:
+            audio, _ = sf.read(file_path, dtype='float32', always_2d=False)
+            return audio, sr
+
+        cache_file = self._cache_file(checksum or self.calculate_checksum(file_path), sr, '.npy')
+        if cache_file.exists():
+            try:
+                # Copy-on-write mapping: pages load on demand and callers may still modify it
+                return np.load(cache_file, mmap_mode='c'), sr
+            except (OSError, ValueError):
+                pass  # Truncated or evicted mid-read: decode again
+
+        try:
+            audio = self.load_audio_ffmpeg(file_path, sr=sr)
+        except Exception:
+            # ffmpeg missing or unable to decode: fall back to librosa
+            import librosa
+            audio, _ = librosa.load(file_path, sr=sr, mono=True, res_type='soxr_hq')
+
+        # Write under a temporary name so readers never see a partial file
+        tmp_file = cache_file.with_name(f"{cache_file.stem}.{os.getpid()}.tmp.npy")
+        try:
+            np.save(tmp_file, audio)
+            os.replace(tmp_file, cache_file)
+            self._evict_cache()
+        except OSError:
+            tmp_file.unlink(missing_ok=True)
+
+        return audio, sr
+
+    def load_audio_ffmpeg(self, file_path: str, sr: int = 16000) -> np.ndarray:
+        """
+        Decode, resample and downmix audio in one ffmpeg pass.
+
+        ffmpeg writes raw 16-bit mono PCM to a pipe, which is read straight
+        into numpy, so no intermediate WAV is written or re-read.
+
+        Args:
+            file_path: Path to audio (or video) file
+            sr: Target sample rate
+
+        Returns:
+            float32 audio array in [-1, 1)
+        """
+        cmd = [
+            'ffmpeg',
+            '-nostdin',
+            '-v', 'error',
+            '-i', file_path,
+            '-ar', str(sr),  # Sample rate
+            '-ac', '1',  # Mono
+            '-f', 's16le',
+            '-acodec', 'pcm_s16le',
+            '-'
+        ]
+
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as process:
+            pcm, stderr = process.communicate()
+        if process.returncode != 0:
+            raise Exception(f"ffmpeg decoding failed: {stderr.decode(errors='replace')}")
+
+        # Scale in place so only one float32 buffer is ever allocated
+        audio = np.frombuffer(pcm, dtype=np.int16).astype(np.float32)
+        audio *= 1.0 / 32768.0
+        return audio
 
     def save_audio_chunk(self, audio: np.ndarray, sr: int, output_path: str) -> str:
         """
@@ -1,8 +1,10 @@
 """Speaker diarization service."""
 
-from typing import List, Dict, Optional
+import heapq
+from typing import List, Dict, Optional, Union
 from pathlib import Path
 import numpy as np
+import torch
 
 
 class DiarizationService:
@@ -22,6 +24,7 @@ class DiarizationService:
         """
         self.model_name = model_name
         self.pipeline = None
+        self.device = 'cuda' if torch.cuda.is_available() else 'cpu'
         self._initialize_pipeline()
 
     def _initialize_pipeline(self):
@@ -32,33 +35,44 @@ class DiarizationService:
             # This requires HuggingFace token for model download
             # For now, we'll leave it as optional
             # self.pipeline = Pipeline.from_pretrained(self.model_name)
-            pass
+            if self.pipeline is not None:
+                # Segmentation and embedding models dominate runtime; run them on the GPU
+                self.pipeline.to(torch.device(self.device))
         except ImportError:
             print("Warning: pyannote.audio not installed. Diarization will be disabled.")
             self.pipeline = None
 
     def diarize(
         self,
-        audio_path: str,
-        num_speakers: Optional[int] = None
+        audio: Union[str, np.ndarray],
+        num_speakers: Optional[int] = None,
+        sample_rate: int = 16000
     ) -> List[Dict]:
         """
-        Perform speaker diarization on audio file.
+        Perform speaker diarization on audio.
 
         Args:
-            audio_path: Path to audio file
+            audio: Path to audio file, or decoded mono samples (no file needed)
             num_speakers: Optional number of speakers (if known)
+            sample_rate: Sample rate of decoded samples (ignored for paths)
 
         Returns:
             List of speaker segments with start, end, and speaker label
         """
         if self.pipeline is None:
             # Return mock diarization for testing
-            return self._mock_diarization(audio_path)
+            return self._mock_diarization(audio, sample_rate)
+
+        # pyannote takes in-memory audio as a (channel, time) waveform
+        if isinstance(audio, np.ndarray):
+            pipeline_input = {'waveform': torch.from_numpy(audio).unsqueeze(0), 'sample_rate': sample_rate}
+        else:
+            pipeline_input = audio
 
         try:
-            # Run diarization
-            diarization = self.pipeline(audio_path)
+            # Run diarization; embedding extraction uses fp16 tensor cores on CUDA
+            with torch.inference_mode(), torch.autocast('cuda', dtype=torch.float16, enabled=self.device == 'cuda'):
+                diarization = self.pipeline(pipeline_input, num_speakers=num_speakers)
 
             # Convert to segment list
             segments = []
@@ -73,9 +87,9 @@ class DiarizationService:
 
         except Exception as e:
             print(f"Diarization failed: {str(e)}")
-            return self._mock_diarization(audio_path)
+            return self._mock_diarization(audio, sample_rate)
 
-    def _mock_diarization(self, audio_path: str) -> List[Dict]:
+    def _mock_diarization(self, audio: Union[str, np.ndarray], sample_rate: int = 16000) -> List[Dict]:
         """
         Create mock diarization for testing purposes.
 
@@ -83,18 +97,22 @@ class DiarizationService:
         In production, replace this with actual pyannote.audio diarization.
 
         Args:
-            audio_path: Path to audio file
+            audio: Path to audio file, or decoded mono samples
+            sample_rate: Sample rate of decoded samples
 
         Returns:
             List of mock speaker segments
         """
         # Get audio duration
-        try:
-            import soundfile as sf
-            info = sf.info(audio_path)
-            duration = info.duration
-        except Exception:
-            duration = 60.0  # Default assumption
+        if isinstance(audio, np.ndarray):
+            duration = len(audio) / sample_rate
+        else:
+            try:
+                import soundfile as sf
+                info = sf.info(audio)
+                duration = info.duration
+            except Exception:
+                duration = 60.0  # Default assumption
 
         # Return single speaker for entire duration
         return [{
@@ -118,23 +136,49 @@ class DiarizationService:
         Returns:
             List of speaker labels corresponding to each chunk
         """
-        chunk_speakers = []
-
-        for chunk in chunks:
-            chunk_start = chunk['start_time']
-            chunk_end = chunk['end_time']
-            chunk_mid = (chunk_start + chunk_end) / 2
-
-            # Find the speaker at the midpoint of the chunk
-            speaker = 'SPEAKER_00'  # Default
-            for segment in speaker_segments:
-                if segment['start'] <= chunk_mid <= segment['end']:
-                    speaker = segment['speaker']
-                    break
-
-            chunk_speakers.append(speaker)
-
-        return chunk_speakers
+        if not chunks:
+            return []
+        if not speaker_segments:
+            return ['SPEAKER_00'] * len(chunks)
+
+        starts = np.array([segment['start'] for segment in speaker_segments], dtype=np.float64)
+        ends = np.array([segment['end'] for segment in speaker_segments], dtype=np.float64)
+        labels = np.array([segment['speaker'] for segment in speaker_segments], dtype=object)
+
+        # Speaker at the midpoint of each chunk
+        mids = np.array(
+            [(chunk['start_time'] + chunk['end_time']) / 2 for chunk in chunks],
+            dtype=np.float64
+        )
+
+        order = np.argsort(starts, kind='stable')
+        sorted_starts, sorted_ends = starts[order], ends[order]
+
+        if np.all(sorted_starts[1:] > sorted_ends[:-1]):
+            # Disjoint segments (no shared boundary): binary-search the last one starting at or before each midpoint
+            idx = np.clip(np.searchsorted(sorted_starts, mids, side='right') - 1, 0, len(order) - 1)
+            covered = (mids >= sorted_starts[idx]) & (mids <= sorted_ends[idx])
+            owner = order[idx]
+        else:
+            # Overlapping speech: the first segment in list order containing the midpoint wins.
+            # Sweep midpoints in time order, admitting segments as they start into a heap
+            # keyed by list position and dropping ones that ended (they stay ended)
+            covered = np.zeros(len(mids), dtype=bool)
+            owner = np.zeros(len(mids), dtype=np.intp)
+            active = []
+            next_seg = 0
+            for chunk_idx in np.argsort(mids, kind='stable').tolist():
+                mid = mids[chunk_idx]
+                while next_seg < len(order) and sorted_starts[next_seg] <= mid:
+                    heapq.heappush(active, int(order[next_seg]))
+                    next_seg += 1
+                while active and ends[active[0]] < mid:
+                    heapq.heappop(active)
+                if active:
+                    covered[chunk_idx] = True
+                    owner[chunk_idx] = active[0]
+
+        return np.where(covered, labels[owner], 'SPEAKER_00').tolist()
 
     def aggregate_speaker_stats(
         self,
@@ -149,20 +193,29 @@ class DiarizationService:
         Returns:
             List of speaker statistics
         """
-        speakers = {}
-
-        for segment in segments:
-            speaker_label = segment.get('speaker_label', 'SPEAKER_00')
-            duration = segment['end_time'] - segment['start_time']
-
-            if speaker_label not in speakers:
-                speakers[speaker_label] = {
-                    'label': speaker_label,
-                    'total_time': 0.0,
-                    'num_segments': 0
-                }
-
-            speakers[speaker_label]['total_time'] += duration
-            speakers[speaker_label]['num_segments'] += 1
-
-        return list(speakers.values())
+        if not segments:
+            return []
+
+        # Integer code per speaker, in order of first appearance
+        codes = {}
+        speaker_idx = np.array(
+            [codes.setdefault(segment.get('speaker_label', 'SPEAKER_00'), len(codes)) for segment in segments],
+            dtype=np.intp
+        )
+        durations = np.array(
+            [segment['end_time'] - segment['start_time'] for segment in segments],
+            dtype=np.float64
+        )
+
+        # One vectorized reduction per statistic
+        total_times = np.bincount(speaker_idx, weights=durations, minlength=len(codes))
+        num_segments = np.bincount(speaker_idx, minlength=len(codes))
+
+        return [
+            {
+                'label': speaker_label,
+                'total_time': float(total_times[idx]),
+                'num_segments': int(num_segments[idx])
+            }
+            for speaker_label, idx in codes.items()
+        ]
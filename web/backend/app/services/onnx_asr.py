@@ -0,0 +1,115 @@
+"""INT8 ONNX Runtime backend for CTC models on CPU."""
+
+import io
+import json
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+import numpy as np
+import soundfile as sf
+
+from ..core.config import settings
+
+# ONNX Runtime is only needed for CPU deployments that ship a quantized export
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+
+# SentencePiece word-boundary marker in token pieces
+WORD_BOUNDARY = '▁'
+
+
+def onnx_model_paths(full_model_name: str) -> Tuple[Path, Path]:
+    """
+    Locate the quantized export of a model.
+
+    Args:
+        full_model_name: Model card name (e.g., 'omniASR_CTC_1B')
+
+    Returns:
+        Tuple of (onnx model path, vocabulary json path)
+    """
+    onnx_dir = Path(settings.MODEL_CACHE_DIR) / "onnx"
+    return onnx_dir / f"{full_model_name}.int8.onnx", onnx_dir / f"{full_model_name}.vocab.json"
+
+
+def onnx_model_available(full_model_name: str) -> bool:
+    """Whether ONNX Runtime is installed and an INT8 export exists for the model."""
+    model_path, vocab_path = onnx_model_paths(full_model_name)
+    return ort is not None and model_path.exists() and vocab_path.exists()
+
+
+class OnnxCTCModel:
+    """
+    Run a quantized CTC acoustic model with ONNX Runtime and decode greedily.
+
+    Exports are produced offline by ``python -m app.tools.quantize_asr``.
+    """
+
+    def __init__(self, full_model_name: str):
+        """
+        Load the INT8 model and its vocabulary.
+
+        Args:
+            full_model_name: Model card name (e.g., 'omniASR_CTC_1B')
+        """
+        model_path, vocab_path = onnx_model_paths(full_model_name)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(
+            str(model_path),
+            sess_options=options,
+            providers=['CPUExecutionProvider']
+        )
+        self.input_name = self.session.get_inputs()[0].name
+
+        with open(vocab_path, 'r', encoding='utf-8') as f:
+            vocab = json.load(f)
+        self.tokens = np.array(vocab['tokens'], dtype=object)
+        self.blank_id = vocab['blank_id']
+        self.sample_rate = vocab.get('sample_rate', 16000)
+
+    def _load(self, audio: Union[str, np.ndarray, bytes]) -> np.ndarray:
+        """Read audio into a mono float32 array at the model's sample rate."""
+        if isinstance(audio, np.ndarray):
+            waveform = audio
+        else:
+            source = io.BytesIO(audio) if isinstance(audio, bytes) else audio
+            waveform, sr = sf.read(source, dtype='float32', always_2d=True)
+            if sr != self.sample_rate:
+                raise ValueError(f"Expected {self.sample_rate} Hz audio, got {sr} Hz")
+            waveform = waveform.mean(axis=1)
+        return np.ascontiguousarray(waveform, dtype=np.float32)
+
+    def _decode(self, token_ids: np.ndarray) -> str:
+        """Greedy CTC decoding: collapse repeats, drop blanks, join pieces."""
+        keep = np.ones(len(token_ids), dtype=bool)
+        keep[1:] = token_ids[1:] != token_ids[:-1]
+        keep &= token_ids != self.blank_id
+        text = ''.join(self.tokens[token_ids[keep]])
+        return text.replace(WORD_BOUNDARY, ' ').strip()
+
+    def transcribe_batch(
+        self,
+        audio_list: List[Union[str, np.ndarray, bytes]],
+        language: Optional[str] = None
+    ) -> List[str]:
+        """
+        Transcribe clips one at a time (variable lengths need no padding).
+
+        Args:
+            audio_list: Audio file paths, numpy arrays, or bytes
+            language: Ignored; CTC models are language-agnostic
+
+        Returns:
+            List of transcribed texts
+        """
+        results = []
+        for audio in audio_list:
+            waveform = self._load(audio)[np.newaxis, :]
+            output = self.session.run(None, {self.input_name: waveform})[0]
+            # Current exports emit token IDs; older ones emit logits
+            token_ids = output[0] if output.ndim == 2 else output[0].argmax(axis=-1)
+            results.append(self._decode(token_ids))
+        return results
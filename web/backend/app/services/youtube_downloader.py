@@ -1,10 +1,17 @@
 """YouTube audio extraction service."""
 
 import os
+import re
+import threading
 import yt_dlp
 from pathlib import Path
 from typing import Dict, Optional
 
+# Matches the 11-character video ID in watch, short, embed, live and youtu.be URLs
+VIDEO_ID_PATTERN = re.compile(
+    r'(?:[?&]v=|/shorts/|/embed/|/live/|/v/|youtu\.be/)([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])'
+)
+
 
 class YouTubeDownloader:
     """Download and extract audio from YouTube videos."""
@@ -19,6 +26,43 @@ class YouTubeDownloader:
         self.output_dir = Path(output_dir or "/tmp/youtube_downloads")
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # One YoutubeDL per thread, kept across downloads so cookies and HTTP
+        # connections are reused (downloads run concurrently in the threadpool)
+        self._local = threading.local()
+
+    def _get_ydl(self) -> yt_dlp.YoutubeDL:
+        """Get this thread's YoutubeDL instance, creating it on first use."""
+        ydl = getattr(self._local, 'ydl', None)
+        if ydl is None:
+            # Configure yt-dlp options with better headers to avoid 403 errors
+            ydl_opts = {
+                'format': 'bestaudio/best',
+                'postprocessors': [{
+                    'key': 'FFmpegExtractAudio',
+                    'preferredcodec': 'wav',
+                    'preferredquality': '0',
+                }],
+                # Extract straight to 16kHz mono, the rate the pipeline decodes to,
+                # so the WAV is read as-is instead of being resampled again
+                'postprocessor_args': {'extractaudio': ['-ar', '16000', '-ac', '1']},
+                'outtmpl': str(self.output_dir / '%(id)s.%(ext)s'),
+                'quiet': False,  # Show errors
+                'no_warnings': False,
+                'extract_flat': False,
+                # Fetch DASH/HLS fragments in parallel, and plain streams in 10 MiB ranges
+                'concurrent_fragment_downloads': 8,
+                'http_chunk_size': 10 * 1024 * 1024,
+                # Add headers to avoid 403 Forbidden
+                'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                'referer': 'https://www.youtube.com/',
+                # Additional options for better compatibility
+                'nocheckcertificate': True,
+                'ignoreerrors': False,
+                'no_color': True,
+            }
+            ydl = self._local.ydl = yt_dlp.YoutubeDL(ydl_opts)
+        return ydl
+
     def download_audio(
         self,
         url: str,
@@ -34,46 +78,27 @@ class YouTubeDownloader:
         Returns:
             Dictionary with download info (file_path, title, duration, etc.)
         """
-        # Configure yt-dlp options with better headers to avoid 403 errors
-        ydl_opts = {
-            'format': 'bestaudio/best',
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'wav',
-                'preferredquality': '192',
-            }],
-            'outtmpl': str(self.output_dir / (output_filename or '%(id)s.%(ext)s')),
-            'quiet': False,  # Show errors
-            'no_warnings': False,
-            'extract_flat': False,
-            # Add headers to avoid 403 Forbidden
-            'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'referer': 'https://www.youtube.com/',
-            # Additional options for better compatibility
-            'nocheckcertificate': True,
-            'ignoreerrors': False,
-            'no_color': True,
-        }
-
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                # Extract video info
-                info = ydl.extract_info(url, download=True)
-
-                # Get the downloaded file path
-                output_path = ydl.prepare_filename(info)
-                # Replace extension with .wav (since we're extracting audio)
-                output_path = os.path.splitext(output_path)[0] + '.wav'
-
-                return {
-                    'file_path': output_path,
-                    'title': info.get('title', 'Unknown'),
-                    'duration': info.get('duration', 0),
-                    'uploader': info.get('uploader', 'Unknown'),
-                    'upload_date': info.get('upload_date', None),
-                    'url': url,
-                    'video_id': info.get('id', None),
-                }
+            ydl = self._get_ydl()
+            ydl.params['outtmpl'] = {'default': str(self.output_dir / (output_filename or '%(id)s.%(ext)s'))}
+
+            # Extract video info
+            info = ydl.extract_info(url, download=True)
+
+            # Get the downloaded file path
+            output_path = ydl.prepare_filename(info)
+            # Replace extension with .wav (since we're extracting audio)
+            output_path = os.path.splitext(output_path)[0] + '.wav'
+
+            return {
+                'file_path': output_path,
+                'title': info.get('title', 'Unknown'),
+                'duration': info.get('duration', 0),
+                'uploader': info.get('uploader', 'Unknown'),
+                'upload_date': info.get('upload_date', None),
+                'url': url,
+                'video_id': info.get('id', None),
+            }
 
         except Exception as e:
             raise Exception(f"Failed to download YouTube audio: {str(e)}")
@@ -90,3 +115,17 @@ class YouTubeDownloader:
         """
         youtube_domains = ['youtube.com', 'youtu.be', 'www.youtube.com', 'm.youtube.com']
         return any(domain in url.lower() for domain in youtube_domains)
+
+    @staticmethod
+    def extract_video_id(url: str) -> Optional[str]:
+        """
+        Extract the canonical video ID from a YouTube URL.
+
+        Args:
+            url: YouTube video URL
+
+        Returns:
+            Video ID, or None if the URL does not contain one
+        """
+        match = VIDEO_ID_PATTERN.search(url)
+        return match.group(1) if match else None
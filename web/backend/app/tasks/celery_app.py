@@ -1,6 +1,7 @@
 """Celery application configuration."""
 
 from celery import Celery
+from kombu import Exchange, Queue
 from ..core.config import settings
 
 # Create Celery app
@@ -13,14 +14,31 @@ celery_app = Celery(
 
 # Configure Celery
 celery_app.conf.update(
-    task_serializer='json',
-    accept_content=['json'],
-    result_serializer='json',
+    # msgpack is smaller and faster to (de)serialize than JSON; JSON is still
+    # accepted so messages queued before an upgrade drain normally
+    task_serializer='msgpack',
+    accept_content=['msgpack', 'json'],
+    result_serializer='msgpack',
+    result_accept_content=['msgpack', 'json'],
     timezone='UTC',
     enable_utc=True,
     task_track_started=True,
     task_time_limit=7200,  # 2 hours max per task (increased from 1 hour)
+    # Redis redelivers unacked (acks_late) tasks after the visibility timeout, 1 hour by
+    # default; keep it above task_time_limit so a long job isn't started a second time
+    broker_transport_options={'visibility_timeout': 3 * 3600},
     worker_prefetch_multiplier=1,  # Process one task at a time per worker
-    worker_max_tasks_per_child=100,  # Restart worker after 100 tasks (keep model in memory longer)
+    worker_max_tasks_per_child=1000,  # Recycle rarely: models are loaded once per worker process and reused
+    # Child processes load models in worker_process_init before reporting up; the
+    # default 4 s allowance would have every child killed and respawned in a loop
+    worker_proc_alive_timeout=settings.WORKER_STARTUP_TIMEOUT,
     broker_connection_retry_on_startup=True,  # Fix deprecation warning
+    # Long ASR jobs go to a durable queue of their own
+    task_queues=(
+        Queue('transcription.long', Exchange('transcription.long'), routing_key='transcription.long'),
+    ),
+    task_default_queue='transcription.long',
+    task_routes={
+        'app.tasks.transcription_tasks.process_transcription': {'queue': 'transcription.long'},
+    },
 )
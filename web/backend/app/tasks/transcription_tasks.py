@@ -1,15 +1,21 @@
 """Celery tasks for transcription processing."""
 
 import time
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
+import numpy as np
 from celery import Task
+from celery.signals import worker_process_init
+from sqlalchemy import bindparam, delete, insert, update
 from sqlalchemy.orm import Session
 
 from .celery_app import celery_app
-from ..database import SessionLocal
+from ..database import CONCURRENT_WRITERS, COPY_MIN_ROWS, SessionLocal, bulk_insert_with_copy
 from ..models import ProcessingJob, JobStatus, TranscriptionSegment, Speaker, DetectedLanguage, Translation
-from ..services.audio_processor import AudioProcessor
+from ..services import audio_processor
 from ..services.vad_chunker import VADChunker
 from ..services.asr_service import ASRService
 from ..services.diarization_service import DiarizationService
@@ -18,23 +24,159 @@ from ..services.language_detector import LanguageDetector
 from ..core.config import settings
 
 
+# Runs diarization alongside transcription; torch releases the GIL in both
+diarization_executor = ThreadPoolExecutor(max_workers=1)
+
+
+def diarize_chunks(audio: np.ndarray, sr: int, chunks: List[Dict]) -> List[Optional[str]]:
+    """
+    Diarize decoded audio and label each chunk with its dominant speaker.
+
+    Args:
+        audio: The job's decoded mono audio
+        sr: Sample rate
+        chunks: Audio chunks with start/end times
+
+    Returns:
+        Speaker label for each chunk
+    """
+    diarization_service = get_diarization_service()
+    speaker_segments = diarization_service.diarize(audio, sample_rate=sr)
+    return diarization_service.map_speakers_to_chunks(speaker_segments, chunks)
+
+
+# Settings of the ASR service cached by _asr_service
+_asr_service_key = None
+
+
+@lru_cache(maxsize=1)
+def _asr_service(model_name: str, device: str, dtype: str, compile_model: bool) -> ASRService:
+    """Build the ASR service held for get_asr_service."""
+    return ASRService(model_name=model_name, device=device, dtype=dtype, compile_model=compile_model)
+
+
+def get_asr_service(model_name: str, device: str, dtype: str, compile_model: bool) -> ASRService:
+    """
+    ASR service shared by every task in this worker process that uses the same model settings.
+
+    Only one is kept, since each holds its model in GPU memory: a job for
+    another model drops the cached service before the new one loads.
+    """
+    global _asr_service_key
+    key = (model_name, device, dtype, compile_model)
+    if _asr_service_key not in (None, key):
+        _asr_service.cache_clear()
+    _asr_service_key = key
+    return _asr_service(*key)
+
+
+@lru_cache(maxsize=1)
+def get_diarization_service() -> DiarizationService:
+    """Diarization service shared by every task in this worker process."""
+    return DiarizationService()
+
+
+@lru_cache(maxsize=1)
+def get_translation_service() -> TranslationService:
+    """Translation service shared by every task in this worker process."""
+    return TranslationService(
+        device=settings.DEVICE,
+        cache_dir=settings.MODEL_CACHE_DIR,
+        num_beams=settings.TRANSLATION_NUM_BEAMS,
+        compile_model=settings.TORCH_COMPILE
+    )
+
+
+@worker_process_init.connect
+def warm_load_models(**kwargs):
+    """Load the default ASR, VAD and translation models when a worker process starts, not on its first task."""
+    if not settings.WARM_LOAD_MODELS:
+        return
+
+    try:
+        get_asr_service(settings.DEFAULT_MODEL, settings.DEVICE, settings.DTYPE, settings.TORCH_COMPILE)
+        VADChunker()
+        get_translation_service()._load_model()
+    except Exception as e:
+        # Tasks load models lazily anyway; a failed warm-up must not kill the worker
+        print(f"Model warm-up failed: {str(e)}")
+
+
 class DatabaseTask(Task):
     """Base task with database session."""
     _db: Session = None
 
+    # Minimum seconds between debounced progress commits
+    PROGRESS_COMMIT_INTERVAL = 2.0
+
+    # Minimum progress gain (percent) between in-step PROGRESS states
+    PROGRESS_STATE_MIN_STEP = 5
+    _last_progress_commit: float = 0.0
+
     @property
     def db(self):
         if self._db is None:
             self._db = SessionLocal()
         return self._db
 
+    def commit_progress(
+        self,
+        job: ProcessingJob,
+        progress: int,
+        step: str,
+        force: bool = True,
+        status: Optional[JobStatus] = None,
+        with_results: bool = False
+    ):
+        """
+        Record job progress in the database.
+
+        Progress is normally written by a short-lived session of its own, so
+        the task's other writes wait for the commit at the end. With
+        with_results, progress commits through the task session together with
+        the results written so far (each transcribed batch's segments, so
+        partial transcripts show up while long files are still running).
+        SQLite can't commit a second writer while the task's transaction is
+        open, so there progress always commits through the task session.
+
+        Step transitions commit right away; frequent in-step updates pass
+        force=False and commit at most every PROGRESS_COMMIT_INTERVAL seconds
+        (the Celery result backend still gets every update via update_state).
+
+        Args:
+            job: Job being processed
+            progress: Progress percentage
+            step: Current step description
+            force: Commit even if the last commit was recent
+            status: New job status (optional)
+            with_results: Also commit the task session's pending writes
+        """
+        now = time.monotonic()
+        if not force and now - self._last_progress_commit < self.PROGRESS_COMMIT_INTERVAL:
+            return
+
+        values = {'current_step': step, 'progress_percent': progress}
+        if status is not None:
+            values['status'] = status
+
+        if CONCURRENT_WRITERS and not with_results:
+            with SessionLocal.begin() as progress_db:
+                progress_db.execute(
+                    update(ProcessingJob).where(ProcessingJob.id == job.id).values(**values)
+                )
+        else:
+            for key, value in values.items():
+                setattr(job, key, value)
+            self.db.commit()
+        self._last_progress_commit = now
+
     def after_return(self, *args, **kwargs):
         if self._db is not None:
             self._db.close()
             self._db = None
 
 
-@celery_app.task(bind=True, base=DatabaseTask)
+@celery_app.task(bind=True, base=DatabaseTask, acks_late=True)
 def process_transcription(self, job_id: int):
     """
     Main transcription processing task.
@@ -51,51 +193,34 @@ def process_transcription(self, job_id: int):
     if not job:
         raise Exception(f"Job {job_id} not found")
 
+    diarization_future = None
     try:
         # Update job status
-        job.status = JobStatus.PROCESSING
-        job.current_step = "Initializing"
-        job.progress_percent = 0
-        db.commit()
+        self.commit_progress(job, 0, "Initializing", status=JobStatus.PROCESSING)
+
+        # A redelivered or retried job starts over, so drop whatever an earlier run wrote
+        clear_job_results(db, job.id)
 
         # Initialize services
-        audio_processor = AudioProcessor(storage_path=settings.STORAGE_PATH)
         vad_chunker = VADChunker()
-        asr_service = ASRService(
-            model_name=job.model_name,
-            device=settings.DEVICE,
-            dtype=settings.DTYPE
-        )
+        asr_service = get_asr_service(job.model_name, settings.DEVICE, settings.DTYPE, settings.TORCH_COMPILE)
 
         # Step 1: Load and convert audio (10%)
         self.update_state(state='PROGRESS', meta={'progress': 10, 'step': 'Loading audio'})
-        job.current_step = "Loading audio"
-        job.progress_percent = 10
-        db.commit()
+        self.commit_progress(job, 10, "Loading audio")
 
         audio_file = job.audio_file
         audio_path = audio_file.file_path
 
-        # Convert to WAV if needed
-        if not audio_path.endswith('.wav'):
-            wav_path = str(Path(settings.STORAGE_PATH) / "processed" / f"{audio_file.id}.wav")
-            audio_processor.convert_to_wav(audio_path, wav_path)
-        else:
-            wav_path = audio_path
-
-        # Step 2: Load audio data (15%)
+        # Step 2: Decode, resample and downmix in a single ffmpeg pass (15%)
         self.update_state(state='PROGRESS', meta={'progress': 15, 'step': 'Processing audio'})
-        job.current_step = "Processing audio"
-        job.progress_percent = 15
-        db.commit()
+        self.commit_progress(job, 15, "Processing audio")
 
-        audio_data, sr = audio_processor.load_audio(wav_path)
+        audio_data, sr = audio_processor.load_audio(audio_path, checksum=audio_file.checksum)
 
         # Step 3: Smart chunking (25%)
         self.update_state(state='PROGRESS', meta={'progress': 25, 'step': 'Creating chunks'})
-        job.current_step = "Creating smart chunks"
-        job.progress_percent = 25
-        db.commit()
+        self.commit_progress(job, 25, "Creating smart chunks")
 
         chunks = vad_chunker.smart_chunk_audio(
             audio_data,
@@ -106,135 +231,78 @@ def process_transcription(self, job_id: int):
             overlap=0.5
         )
 
-        # Save chunks to files
-        chunks_dir = Path(settings.STORAGE_PATH) / "chunks" / str(job.id)
-        chunk_paths = vad_chunker.save_chunks(
-            chunks,
-            chunks_dir,
-            f"audio_{audio_file.id}",
-            sr=sr
-        )
+        # Chunks stay in memory as views over audio_data; they are only written
+        # to files when PERSIST_CHUNKS is set, for debugging
+        if settings.PERSIST_CHUNKS:
+            chunks_dir = Path(settings.STORAGE_PATH) / "chunks" / str(job.id)
+            chunk_paths = vad_chunker.save_chunks(
+                chunks,
+                chunks_dir,
+                f"audio_{audio_file.id}",
+                sr=sr
+            )
 
-        # Update chunks with file paths
-        for chunk, path in zip(chunks, chunk_paths):
-            chunk['file_path'] = path
+            # Update chunks with file paths
+            for chunk, path in zip(chunks, chunk_paths):
+                chunk['file_path'] = path
 
-        # Step 4: Speaker diarization (if enabled) (35%)
-        speaker_labels = None
+        # Step 4: Speaker diarization (if enabled) (35%), run in the background
+        # while the chunks are transcribed; speakers are attached afterwards
         if job.enable_diarization:
             self.update_state(state='PROGRESS', meta={'progress': 35, 'step': 'Identifying speakers'})
-            job.current_step = "Identifying speakers"
-            job.progress_percent = 35
-            db.commit()
+            self.commit_progress(job, 35, "Identifying speakers")
 
-            diarization_service = DiarizationService()
-            speaker_segments = diarization_service.diarize(wav_path)
-            speaker_labels = diarization_service.map_speakers_to_chunks(speaker_segments, chunks)
+            # Diarize the decoded samples directly; no intermediate WAV is written
+            diarization_future = diarization_executor.submit(diarize_chunks, audio_data, sr, chunks)
 
         # Step 5: Transcribe chunks (40-90%) - BATCH PROCESSING
         total_chunks = len(chunks)
 
-        # Prepare batch inputs
-        chunk_paths = [chunk['file_path'] for chunk in chunks]
+        # Prepare batch inputs: the decoded chunk arrays themselves
+        chunk_audio = [chunk['audio'] for chunk in chunks]
 
         # Update progress to show batch transcription starting
         self.update_state(state='PROGRESS', meta={'progress': 40, 'step': 'Transcribing all chunks (batch mode)'})
-        job.current_step = f"Transcribing {total_chunks} chunks in batch mode"
-        job.progress_percent = 40
-        db.commit()
-
-        # Transcribe all chunks in batch (much faster!)
-        try:
-            # Use batch size of 4 for optimal GPU/CPU utilization
-            batch_size = 4 if total_chunks > 1 else 1
-            transcriptions = asr_service.transcribe_batch(
-                chunk_paths,
-                language=job.language_hint,
-                batch_size=batch_size
-            )
-
-            # Update progress to 90% after batch completion
-            self.update_state(state='PROGRESS', meta={'progress': 90, 'step': 'Batch transcription completed'})
-            job.current_step = "Batch transcription completed"
-            job.progress_percent = 90
-            db.commit()
-
-        except Exception as e:
-            print(f"Batch transcription failed: {str(e)}, falling back to sequential")
-
-            # Fallback to sequential processing if batch fails
-            transcriptions = []
-            for idx, chunk in enumerate(chunks):
-                progress = 40 + int((idx / total_chunks) * 50)
-                step = f"Transcribing chunk {idx + 1}/{total_chunks}"
+        self.commit_progress(job, 40, f"Transcribing {total_chunks} chunks in batch mode")
 
+        # Fill batches up to the configured size (ASR_BATCH_SIZE), or one sized to
+        # free GPU memory; each batch's segments are committed with the (debounced)
+        # progress update after it finishes, so partial transcripts show up early
+        if settings.ASR_BATCH_SIZE > 0:
+            batch_size = max(1, min(settings.ASR_BATCH_SIZE, total_chunks))
+        else:
+            batch_size = asr_service.pick_batch_size(chunk_audio, sr=sr)
+        print(f"Transcribing {total_chunks} chunks with batch size {batch_size}")
+        transcriptions = []
+        last_reported = 40
+        for start, texts in asr_service.stream_transcribe(
+            chunk_audio,
+            language=job.language_hint,
+            batch_size=batch_size
+        ):
+            write_job_segments(db, job.id, chunks, texts, start)
+            transcriptions.extend(texts)
+
+            progress = 40 + int((len(transcriptions) / total_chunks) * 50)
+            step = f"Transcribed {len(transcriptions)}/{total_chunks} chunks"
+            # Each PROGRESS state is a result-backend write; skip ones that barely move
+            if progress - last_reported >= self.PROGRESS_STATE_MIN_STEP or len(transcriptions) == total_chunks:
                 self.update_state(state='PROGRESS', meta={'progress': progress, 'step': step})
-                job.current_step = step
-                job.progress_percent = progress
-                db.commit()
-
-                try:
-                    text = asr_service.transcribe(
-                        chunk['file_path'],
-                        language=job.language_hint
-                    )
-                    transcriptions.append(text)
-                except Exception as e:
-                    print(f"Error transcribing chunk {idx}: {str(e)}")
-                    transcriptions.append("")
-
-        # Step 6: Save transcription segments (95%)
-        self.update_state(state='PROGRESS', meta={'progress': 95, 'step': 'Saving results'})
-        job.current_step = "Saving results"
-        job.progress_percent = 95
-        db.commit()
-
-        # Create speaker records
-        if speaker_labels:
-            unique_speakers = list(set(speaker_labels))
-            speaker_map = {}
-
-            for speaker_label in unique_speakers:
-                speaker = Speaker(
-                    job_id=job.id,
-                    speaker_label=speaker_label,
-                    total_speaking_time=0.0,
-                    num_segments=0
-                )
-                db.add(speaker)
-                db.flush()  # Get speaker ID
-                speaker_map[speaker_label] = speaker.id
-
-        # Save transcription segments
-        for idx, (chunk, text) in enumerate(zip(chunks, transcriptions)):
-            speaker_id = None
-            if speaker_labels and idx < len(speaker_labels):
-                speaker_label = speaker_labels[idx]
-                speaker_id = speaker_map.get(speaker_label)
-
-            segment = TranscriptionSegment(
-                job_id=job.id,
-                chunk_index=idx,
-                start_time=chunk['start_time'],
-                end_time=chunk['end_time'],
-                text=text,
-                speaker_id=speaker_id,
-                chunk_file_path=chunk.get('file_path')
-            )
-            db.add(segment)
-
-            # Update speaker stats
-            if speaker_id:
-                speaker = db.query(Speaker).filter(Speaker.id == speaker_id).first()
-                if speaker:
-                    speaker.total_speaking_time += (chunk['end_time'] - chunk['start_time'])
-                    speaker.num_segments += 1
+                last_reported = progress
+            self.commit_progress(job, progress, step, force=False, with_results=True)
 
-        # Step 7: Detect language (95%)
+        # Speaker rows, then each segment's speaker, once diarization has finished
+        speaker_labels = None
+        speaker_map = {}
+        if diarization_future is not None:
+            speaker_labels = diarization_future.result()
+            speaker_map = write_job_speakers(db, job.id, chunks, speaker_labels)
+            write_segment_speakers(db, job.id, speaker_labels, speaker_map)
+            self.commit_progress(job, 90, "Speakers assigned")
+
+        # Step 6: Detect language (95%)
         self.update_state(state='PROGRESS', meta={'progress': 95, 'step': 'Detecting language'})
-        job.current_step = "Detecting language"
-        job.progress_percent = 95
-        db.commit()
+        self.commit_progress(job, 95, "Detecting language")
 
         # Detect language from transcribed text
         if job.language_hint:
@@ -244,14 +312,18 @@ def process_transcription(self, job_id: int):
             confidence = 1.0
             print(f"DEBUG: Using language hint: {source_language}")
         else:
-            # Detect from transcribed text
-            full_text = " ".join(transcriptions)
-            print(f"DEBUG: Full text for detection ({len(full_text)} chars): {full_text[:200]}")
-            detection_result = LanguageDetector.detect_language(full_text)
-            print(f"DEBUG: Detection result: {detection_result}")
-            source_language = detection_result['language_code']
-            lang_name = detection_result['language_name']
-            confidence = detection_result['confidence']
+            # Detect from the start of the transcribed text
+            sample = detection_sample(transcriptions, LanguageDetector.SAMPLE_MAX_CHARS)
+            print(f"DEBUG: Text sample for detection ({len(sample)} chars): {sample[:200]}")
+            if not sample:
+                # Nothing was transcribed (silent audio)
+                source_language, lang_name, confidence = "und", "Unknown", 0.0
+            else:
+                detection_result = LanguageDetector.detect_language(sample)
+                print(f"DEBUG: Detection result: {detection_result}")
+                source_language = detection_result['language_code']
+                lang_name = detection_result['language_name']
+                confidence = detection_result['confidence']
             print(f"DEBUG: Final language: {source_language} ({lang_name})")
 
         detected_lang = DetectedLanguage(
@@ -262,21 +334,15 @@ def process_transcription(self, job_id: int):
             time_percentage=100.0
         )
         db.add(detected_lang)
-        db.commit()
 
-        # Step 8: Translation (if enabled) (96-99%)
-        if job.enable_translation and job.target_language != source_language:
+        # Step 7: Translation (if enabled) (96-99%)
+        if job.enable_translation and job.target_language != source_language and any(transcriptions):
             self.update_state(state='PROGRESS', meta={'progress': 96, 'step': 'Translating transcription'})
-            job.current_step = "Translating transcription"
-            job.progress_percent = 96
-            db.commit()
+            self.commit_progress(job, 96, "Translating transcription")
 
             try:
-                # Initialize translation service
-                translation_service = TranslationService(
-                    device=settings.DEVICE,
-                    cache_dir=settings.MODEL_CACHE_DIR
-                )
+                # Shared translation service (model loaded once per worker process)
+                translation_service = get_translation_service()
 
                 # Translate in batch for efficiency (transcriptions is already a list of strings)
                 translated_texts = translation_service.translate_batch(
@@ -287,12 +353,7 @@ def process_transcription(self, job_id: int):
                 )
 
                 # Update segments with translations
-                segments = db.query(TranscriptionSegment).filter(
-                    TranscriptionSegment.job_id == job.id
-                ).order_by(TranscriptionSegment.chunk_index).all()
-
-                for segment, translated_text in zip(segments, translated_texts):
-                    segment.translated_text = translated_text
+                write_segment_translations(db, job.id, translated_texts)
 
                 # Create full translated text
                 full_translated_text = " ".join(translated_texts)
@@ -306,21 +367,19 @@ def process_transcription(self, job_id: int):
                     translation_model="facebook/nllb-200-distilled-600M"
                 )
                 db.add(translation_record)
-                db.commit()
 
                 print(f"Translation completed: {source_language} -> {job.target_language}")
 
             except Exception as e:
                 print(f"Translation error: {str(e)}")
                 # Continue even if translation fails
-                job.current_step = "Translation failed, continuing..."
-                db.commit()
+                self.commit_progress(job, 96, "Translation failed, continuing...")
 
-        # Complete job (100%)
+        # Complete job (100%), committing the remaining results with the final status
         job.status = JobStatus.COMPLETED
         job.current_step = "Completed"
         job.progress_percent = 100
-        job.completed_at = db.query(ProcessingJob).filter(ProcessingJob.id == job_id).first().created_at  # Use current time
+        job.completed_at = datetime.utcnow()
         db.commit()
 
         return {
@@ -331,10 +390,201 @@ def process_transcription(self, job_id: int):
         }
 
     except Exception as e:
-        # Handle errors
+        # The diarization thread is shared by the worker's tasks: don't leave this
+        # job's run queued or running (holding its audio) ahead of the next job
+        if diarization_future is not None and not diarization_future.cancel():
+            wait([diarization_future])
+
+        # Handle errors: drop uncommitted results, then record the failure
+        # (segments already committed stay until the job is rerun)
+        db.rollback()
         job.status = JobStatus.FAILED
         job.error_message = str(e)
         job.current_step = "Failed"
         db.commit()
 
         raise e
+
+
+def clear_job_results(db: Session, job_id: int) -> None:
+    """
+    Delete a job's segments, speakers, detected languages and translations.
+
+    Args:
+        db: Database session
+        job_id: Job ID
+    """
+    # Segments first: they reference speakers
+    for model in (TranscriptionSegment, Speaker, DetectedLanguage, Translation):
+        db.execute(delete(model).where(model.job_id == job_id))
+
+
+def detection_sample(texts: List[str], max_chars: int) -> str:
+    """
+    Join the leading non-empty texts until max_chars is reached.
+
+    Args:
+        texts: Transcribed chunk texts, in order
+        max_chars: Maximum sample length
+
+    Returns:
+        Space-joined sample, empty if every text is empty
+    """
+    parts = []
+    length = 0
+    for text in texts:
+        if text:
+            parts.append(text)
+            length += len(text) + 1
+            if length >= max_chars:
+                break
+    return " ".join(parts)[:max_chars]
+
+
+def write_job_speakers(
+    db: Session,
+    job_id: int,
+    chunks: List[Dict],
+    speaker_labels: Optional[List[str]] = None
+) -> Dict[str, int]:
+    """
+    Insert a job's speakers in one batched INSERT.
+
+    Speaker totals depend only on chunk timings and labels, so they are
+    tallied in memory without reading the segments back.
+
+    Args:
+        db: Database session
+        job_id: Job ID
+        chunks: Audio chunks with start/end times
+        speaker_labels: Speaker label for each chunk (optional)
+
+    Returns:
+        Mapping of speaker label to speaker ID
+    """
+    speaker_labels = speaker_labels or []
+
+    # Tally speaking time and segment count per speaker
+    speaker_stats = {label: [0.0, 0] for label in dict.fromkeys(speaker_labels) if label is not None}
+    for chunk, label in zip(chunks, speaker_labels):
+        if label is not None:
+            speaker_stats[label][0] += chunk['end_time'] - chunk['start_time']
+            speaker_stats[label][1] += 1
+
+    if not speaker_stats:
+        return {}
+
+    # Create speaker records, reading back their IDs
+    rows = db.execute(
+        insert(Speaker).returning(Speaker.id, Speaker.speaker_label),
+        [
+            {
+                'job_id': job_id,
+                'speaker_label': label,
+                'total_speaking_time': total_time,
+                'num_segments': num_segments
+            }
+            for label, (total_time, num_segments) in speaker_stats.items()
+        ]
+    )
+    return {row.speaker_label: row.id for row in rows}
+
+
+def write_job_segments(
+    db: Session,
+    job_id: int,
+    chunks: List[Dict],
+    texts: List[str],
+    start: int
+) -> None:
+    """
+    Insert transcription segments for a run of consecutive chunks in one batched INSERT (or COPY).
+
+    Speakers are attached later by write_segment_speakers, since diarization
+    runs alongside transcription.
+
+    Args:
+        db: Database session
+        job_id: Job ID
+        chunks: All audio chunks of the job
+        texts: Transcribed text for chunks[start:start + len(texts)]
+        start: Index of the first chunk covered by texts
+    """
+    if not texts:
+        return
+
+    rows = [
+        {
+            'job_id': job_id,
+            'chunk_index': idx,
+            'start_time': chunks[idx]['start_time'],
+            'end_time': chunks[idx]['end_time'],
+            'text': text,
+            'chunk_file_path': chunks[idx].get('file_path')
+        }
+        for idx, text in enumerate(texts, start)
+    ]
+
+    # Large batches on PostgreSQL stream in with COPY; anything else is one batched INSERT
+    if len(rows) > COPY_MIN_ROWS and db.get_bind().dialect.name == 'postgresql':
+        bulk_insert_with_copy(db, TranscriptionSegment.__tablename__, rows, columns=list(rows[0]))
+    else:
+        db.execute(insert(TranscriptionSegment), rows)
+
+
+def write_segment_translations(db: Session, job_id: int, translated_texts: List[str]) -> None:
+    """
+    Set translated text on a job's segments in one batched UPDATE.
+
+    Args:
+        db: Database session
+        job_id: Job ID
+        translated_texts: Translated text for each chunk, in chunk order
+    """
+    if not translated_texts:
+        return
+
+    segments = TranscriptionSegment.__table__
+    db.execute(
+        update(segments)
+        .where(segments.c.job_id == bindparam('b_job_id'))
+        .where(segments.c.chunk_index == bindparam('b_chunk_index'))
+        .values(translated_text=bindparam('b_translated_text')),
+        [
+            {'b_job_id': job_id, 'b_chunk_index': idx, 'b_translated_text': text}
+            for idx, text in enumerate(translated_texts)
+        ]
+    )
+
+
+def write_segment_speakers(
+    db: Session,
+    job_id: int,
+    speaker_labels: List[Optional[str]],
+    speaker_map: Dict[str, int]
+) -> None:
+    """
+    Set the speaker of a job's segments in one batched UPDATE.
+
+    Args:
+        db: Database session
+        job_id: Job ID
+        speaker_labels: Speaker label for each chunk, in chunk order
+        speaker_map: Mapping of speaker label to speaker ID
+    """
+    rows = [
+        {'b_job_id': job_id, 'b_chunk_index': idx, 'b_speaker_id': speaker_map[label]}
+        for idx, label in enumerate(speaker_labels)
+        if label in speaker_map
+    ]
+    if not rows:
+        return
+
+    segments = TranscriptionSegment.__table__
+    db.execute(
+        update(segments)
+        .where(segments.c.job_id == bindparam('b_job_id'))
+        .where(segments.c.chunk_index == bindparam('b_chunk_index'))
+        .values(speaker_id=bindparam('b_speaker_id')),
+        rows
+    )
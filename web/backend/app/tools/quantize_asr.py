@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Export a CTC ASR model to ONNX and quantize it to INT8 for CPU inference.
+
+Usage:
+    python -m app.tools.quantize_asr CTC_1B
+
+Writes ``{model}.int8.onnx`` and ``{model}.vocab.json`` under
+``MODEL_CACHE_DIR/onnx``, where ASRService picks them up on CPU.
+"""
+
+import argparse
+import json
+
+import torch
+import torch.nn.functional as F
+from onnxruntime.quantization import QuantType, quantize_dynamic
+
+from ..services.asr_service import ASRService, _get_pipeline
+from ..services.onnx_asr import onnx_model_paths
+
+SAMPLE_RATE = 16000
+
+
+class CTCExportWrapper(torch.nn.Module):
+    """Expose the acoustic model as raw waveform -> greedy CTC token IDs."""
+
+    def __init__(self, model: torch.nn.Module):
+        super().__init__()
+        self.model = model
+
+    def forward(self, waveform: torch.Tensor) -> torch.Tensor:
+        from fairseq2.nn.batch_layout import BatchLayout
+
+        # Same per-utterance normalization the pipeline applies before the encoder
+        waveform = F.layer_norm(waveform, waveform.shape[-1:])
+        layout = BatchLayout.of(waveform)
+        logits, _ = self.model(waveform, layout)
+        # Argmax inside the graph: only [batch, frames] IDs leave the session, not full logits
+        return logits.argmax(dim=-1)
+
+
+def token_pieces(tokenizer, vocab_size: int) -> list:
+    """
+    Read the SentencePiece piece for every token ID.
+
+    Args:
+        tokenizer: Pipeline tokenizer
+        vocab_size: Number of tokens
+
+    Returns:
+        List of token pieces indexed by ID
+    """
+    model = getattr(tokenizer, '_model', None)
+    if model is None or not hasattr(model, 'index_to_token'):
+        raise RuntimeError("Tokenizer does not expose its SentencePiece model")
+    return [model.index_to_token(idx) for idx in range(vocab_size)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('model', help="CTC model name (e.g., CTC_300M, CTC_1B)")
+    parser.add_argument('--opset', type=int, default=17, help="ONNX opset version")
+    args = parser.parse_args()
+
+    if not args.model.startswith('CTC_'):
+        parser.error("Only CTC models can be exported")
+
+    full_model_name = ASRService.MODEL_MAP.get(args.model, args.model)
+    model_path, vocab_path = onnx_model_paths(full_model_name)
+    model_path.parent.mkdir(parents=True, exist_ok=True)
+    fp32_path = model_path.with_name(f"{full_model_name}.fp32.onnx")
+
+    print(f"Loading {full_model_name}...")
+    pipeline = _get_pipeline(args.model, 'cpu', 'float32')
+    wrapper = CTCExportWrapper(pipeline.model).eval()
+
+    print(f"Exporting to {fp32_path}...")
+    with torch.inference_mode():
+        torch.onnx.export(
+            wrapper,
+            torch.zeros(1, SAMPLE_RATE * 10),
+            str(fp32_path),
+            input_names=['waveform'],
+            output_names=['token_ids'],
+            dynamic_axes={'waveform': {0: 'batch', 1: 'samples'}, 'token_ids': {0: 'batch', 1: 'frames'}},
+            opset_version=args.opset
+        )
+
+    # QInt8 weights: QUInt8 is often slower with VNNI/AVX-512 kernels
+    print(f"Quantizing to {model_path}...")
+    quantize_dynamic(
+        str(fp32_path),
+        str(model_path),
+        op_types_to_quantize=['MatMul'],
+        weight_type=QuantType.QInt8
+    )
+    fp32_path.unlink()
+
+    vocab_info = pipeline.tokenizer.vocab_info
+    with open(vocab_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'tokens': token_pieces(pipeline.tokenizer, vocab_info.size),
+            'blank_id': vocab_info.pad_idx,
+            'sample_rate': SAMPLE_RATE
+        }, f, ensure_ascii=False)
+
+    print(f"✅ Wrote {model_path} and {vocab_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -10,9 +10,11 @@ This script tests the complete pipeline:
 5. Retrieve and verify results
 """
 
+import json
 import sys
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import soundfile as sf
 from pathlib import Path
@@ -20,23 +22,26 @@ from pathlib import Path
 # Configuration
 API_BASE = "http://localhost:8123/api"  # Nginx proxies /api to backend
 TEST_AUDIO_PATH = "/tmp/test_audio.wav"
+SSE_READ_TIMEOUT = 60  # seconds without any event or keepalive before the stream counts as stalled
 
 
 def generate_test_audio(duration=10, sample_rate=16000):
     """Generate a simple test audio file with beeps."""
     print("📝 Generating test audio...")
 
-    # Generate a simple sine wave (440 Hz - A note)
-    t = np.linspace(0, duration, int(sample_rate * duration))
+    # Generate a simple sine wave (440 Hz - A note), in float32 and in place
     frequency = 440.0
-    audio = 0.3 * np.sin(2 * np.pi * frequency * t)
+    phase = np.arange(int(sample_rate * duration), dtype=np.float32)
+    phase *= np.float32(2 * np.pi * frequency / sample_rate)
+    audio = np.sin(phase, out=phase)
+    audio *= np.float32(0.3)
 
     # Add some silence in the middle (for VAD testing)
     mid_point = len(audio) // 2
     audio[mid_point:mid_point + sample_rate] = 0
 
     # Save as WAV file
-    sf.write(TEST_AUDIO_PATH, audio, sample_rate)
+    sf.write(TEST_AUDIO_PATH, audio, sample_rate, subtype='PCM_16')
     print(f"✅ Generated test audio: {TEST_AUDIO_PATH}")
 
     return TEST_AUDIO_PATH
@@ -87,13 +92,62 @@ def start_transcription(audio_id, model="CTC_1B"):
     return job_id
 
 
+def _report_status(data, start_time, last_progress):
+    """
+    Print a job status update.
+
+    Returns:
+        Tuple of (finished, succeeded, progress)
+    """
+    status = data['status']
+    progress = data['progress']
+    step = data.get('current_step', 'N/A')
+
+    # Print progress updates
+    if progress != last_progress:
+        print(f"   Progress: {progress:.1f}% - {step}")
+
+    if status == 'completed':
+        print(f"✅ Job completed in {time.time() - start_time:.1f}s")
+        return True, True, progress
+    elif status == 'failed':
+        error = data.get('error_message', 'Unknown error')
+        print(f"❌ Job failed: {error}")
+        return True, False, progress
+
+    return False, False, progress
+
+
 def monitor_job(job_id, timeout=300):
-    """Monitor job progress until completion."""
+    """Monitor job progress until completion, via the event stream when available."""
     print(f"\n⏳ Monitoring job {job_id}...")
 
     start_time = time.time()
     last_progress = -1
 
+    # Progress pushed as server-sent events; fall back to polling if the endpoint is
+    # missing or the stream stalls. The server sends a keepalive comment every 15s
+    # while progress is unchanged, so the read timeout only catches a dead connection
+    try:
+        with requests.get(f"{API_BASE}/jobs/{job_id}/events", stream=True, timeout=SSE_READ_TIMEOUT) as response:
+            if response.status_code == 200:
+                for line in response.iter_lines(decode_unicode=True):
+                    if time.time() - start_time >= timeout:
+                        print(f"❌ Job timed out after {timeout}s")
+                        return False
+                    if not line or not line.startswith('data:'):
+                        continue
+                    finished, succeeded, last_progress = _report_status(
+                        json.loads(line[len('data:'):]), start_time, last_progress
+                    )
+                    if finished:
+                        return succeeded
+            elif response.status_code != 404:
+                print(f"❌ Failed to get job status: {response.text}")
+                return False
+    except requests.exceptions.Timeout:
+        print("⚠️  Event stream stalled, falling back to polling")
+
     while time.time() - start_time < timeout:
         response = requests.get(f"{API_BASE}/jobs/{job_id}")
 
@@ -101,23 +155,9 @@ def monitor_job(job_id, timeout=300):
             print(f"❌ Failed to get job status: {response.text}")
             return False
 
-        data = response.json()
-        status = data['status']
-        progress = data['progress']
-        step = data.get('current_step', 'N/A')
-
-        # Print progress updates
-        if progress != last_progress:
-            print(f"   Progress: {progress:.1f}% - {step}")
-            last_progress = progress
-
-        if status == 'completed':
-            print(f"✅ Job completed in {time.time() - start_time:.1f}s")
-            return True
-        elif status == 'failed':
-            error = data.get('error_message', 'Unknown error')
-            print(f"❌ Job failed: {error}")
-            return False
+        finished, succeeded, last_progress = _report_status(response.json(), start_time, last_progress)
+        if finished:
+            return succeeded
 
         time.sleep(2)
 
@@ -190,9 +230,14 @@ def test_export(job_id):
     export_dir = Path("/tmp/omniasr_exports")
     export_dir.mkdir(exist_ok=True)
 
-    for fmt in formats:
-        response = requests.get(f"{API_BASE}/jobs/{job_id}/export?format={fmt}")
+    def fetch(fmt):
+        return fmt, requests.get(f"{API_BASE}/jobs/{job_id}/export?format={fmt}")
+
+    # Fetch all formats at once so the wait is the slowest export, not the sum
+    with ThreadPoolExecutor(max_workers=len(formats)) as pool:
+        results = list(pool.map(fetch, formats))
 
+    for fmt, response in results:
         if response.status_code == 200:
             output_file = export_dir / f"transcription_{job_id}.{fmt}"
             output_file.write_bytes(response.content)